@@ -22,6 +22,16 @@ SCRCPY_WINDOW_TITLES = os.getenv('SCRCPY_WINDOW_TITLES', 'scrcpy,Mi Band,Android
 # OCR API Settings
 OCR_LANGUAGE = os.getenv('OCR_LANGUAGE', 'en')
 DETECT_ORIENTATION = os.getenv('DETECT_ORIENTATION', 'true').lower() == 'true'
+# Set to 'true' to downscale captures longer than OCR_MAX_DIMENSION on either side and send
+# them as JPEG for OCR (the saved screenshot keeps full resolution). Off by default: the OCR
+# input then stays exactly as captured.
+OCR_DOWNSCALE_ENABLED = os.getenv('OCR_DOWNSCALE_ENABLED', 'false').lower() == 'true'
+OCR_MAX_DIMENSION = int(os.getenv('OCR_MAX_DIMENSION', '1600'))
+# Auto-capture only: stack up to OCR_BATCH_SIZE captures into one OCR request, sending a
+# partial batch after OCR_BATCH_WINDOW_SECS. The default of 1 sends every capture on its own.
+# Batching needs DETECT_ORIENTATION=false; it is turned off while orientation detection is on.
+OCR_BATCH_SIZE = int(os.getenv('OCR_BATCH_SIZE', '1'))
+OCR_BATCH_WINDOW_SECS = int(os.getenv('OCR_BATCH_WINDOW_SECS', '30'))
 
 # USB Stability Settings
 # Set to 'true' to enable screenshot auto-deletion (may cause USB disconnects)
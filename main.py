@@ -69,14 +69,21 @@ import sys
 import os
 import json
 import time
-import random
 import csv
-import glob
+import hashlib
+import heapq
+import io
+import itertools
+import re
+import shutil
+import tempfile
+import threading
+from collections import deque, namedtuple
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from operator import attrgetter, itemgetter
 from typing import Optional, Dict, Any
 
-import pywinctl
-
 # Cross-platform window management
 try:
     import pywinctl as gw  # Cross-platform replacement for pygetwindow
@@ -97,8 +104,11 @@ from PyQt5.QtWidgets import (
     QComboBox, QDialog, QTreeWidget, QTreeWidgetItem, QDialogButtonBox,
     QTableWidget, QTableWidgetItem, QAbstractItemView, QFrame, QSplitter, QTabWidget
 )
-from PyQt5.QtCore import QTimer, QThread, pyqtSignal, Qt, QPropertyAnimation, QEasingCurve
-from PyQt5.QtGui import QFont, QIcon, QColor, QPalette, QLinearGradient, QPainter, QTransform
+from PyQt5.QtCore import (
+    QTimer, QThread, pyqtSignal, Qt, QPropertyAnimation, QEasingCurve,
+    QObject, QRunnable, QThreadPool, QSemaphore
+)
+from PyQt5.QtGui import QFont, QIcon, QColor, QPalette, QLinearGradient, QPainter, QStandardItem
 import mss
 import numpy as np
 from PIL import Image
@@ -159,6 +169,11 @@ except ImportError:
 import platform
 PLATFORM = platform.system().lower()
 
+# MSS on Windows: plain BitBlt, skipping the layered-window composite pass (target windows aren't layered)
+if PLATFORM == 'windows':
+    import mss.windows
+    mss.windows.CAPTUREBLT = 0
+
 # Platform-specific screen capture
 try:
     if PLATFORM == 'windows':
@@ -185,6 +200,47 @@ if PLATFORM == 'linux':
 else:
     LINUX_TOOLS_AVAILABLE = False
 
+# Optional in-process libxdo bindings (avoids spawning xdotool per activation)
+try:
+    if PLATFORM == 'linux':
+        from xdo import Xdo
+        XDO_AVAILABLE = True
+    else:
+        XDO_AVAILABLE = False
+except ImportError:
+    XDO_AVAILABLE = False
+
+# Optional in-process X11 client for region grabs (avoids spawning scrot per capture)
+try:
+    if PLATFORM == 'linux':
+        from Xlib import display as xdisplay, X
+        XLIB_AVAILABLE = True
+    else:
+        XLIB_AVAILABLE = False
+except ImportError:
+    XLIB_AVAILABLE = False
+
+# Optional native PNG encoder (libpng) for BGR frames
+try:
+    import cv2
+    CV2_AVAILABLE = True
+except ImportError:
+    CV2_AVAILABLE = False
+
+# Optional JIT compilation for per-frame pixel scans
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Optional fast JSON serializer for OCR exports
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Cross-platform process management
 try:
     import psutil
@@ -198,7 +254,8 @@ try:
         AZURE_API_KEY, AZURE_ENDPOINT, DEFAULT_CAPTURE_INTERVAL,
         SCREENSHOTS_FOLDER, SCRCPY_WINDOW_TITLES, OCR_LANGUAGE, DETECT_ORIENTATION,
         ENABLE_AUTO_DELETE_SCREENSHOTS, MIN_WINDOW_WIDTH, MIN_WINDOW_HEIGHT,
-        SHOW_SMALL_WINDOW_WARNING, SMALL_WINDOW_WARNING_WIDTH, SMALL_WINDOW_WARNING_HEIGHT
+        SHOW_SMALL_WINDOW_WARNING, SMALL_WINDOW_WARNING_WIDTH, SMALL_WINDOW_WARNING_HEIGHT,
+        OCR_DOWNSCALE_ENABLED, OCR_MAX_DIMENSION, OCR_BATCH_SIZE, OCR_BATCH_WINDOW_SECS
     )
 except ImportError:
     print("ERROR: Configuration not found!")
@@ -208,6 +265,447 @@ except ImportError:
     print("3. Run the application again after setting up .env")
     sys.exit(1)
 
+from ocr_batching import plan_ocr_batches, scaled_length, split_ocr_regions, split_to_fit
+from screenshot_cleanup import bulk_unlink
+
+# Device categorization keywords (checked in order, first matching category wins)
+DEVICE_CATEGORY_KEYWORDS = (
+    ('mobile_phones', frozenset({'phone', 'sm-', 'iphone', 'pixel', 'oneplus', 'xiaomi', 'huawei', 'oppo', 'vivo'})),
+    ('tablets', frozenset({'tablet', 'ipad', 'tab', 'surface'})),
+    ('wearables', frozenset({'watch', 'band', 'fitbit', 'garmin', 'amazfit'})),
+    ('emulators', frozenset({'emulator', 'bluestacks', 'nox', 'memu', 'ldplayer'})),
+    ('dev_tools', frozenset({'scrcpy', 'adb', 'vysor', 'android studio'})),
+)
+
+# Keyword -> category bit (bit position = priority in DEVICE_CATEGORY_KEYWORDS)
+DEVICE_KEYWORD_BIT = {
+    kw: 1 << rank
+    for rank, (_, keywords) in enumerate(DEVICE_CATEGORY_KEYWORDS)
+    for kw in keywords
+}
+DEVICE_BIT_CATEGORY = {1 << rank: category for rank, (category, _) in enumerate(DEVICE_CATEGORY_KEYWORDS)}
+
+# Single-pass matcher for all category keywords; the lookahead reports overlapping
+# matches so a lower-priority keyword can never hide a higher-priority one
+DEVICE_KEYWORD_PATTERN = re.compile(
+    '(?=(' + '|'.join(re.escape(kw) for kw in sorted(DEVICE_KEYWORD_BIT, key=len, reverse=True)) + '))'
+)
+
+
+def _categorize_device_title(title_lower: str) -> str:
+    """Return the device category for a lowercased window title"""
+    mask = 0
+    for m in DEVICE_KEYWORD_PATTERN.finditer(title_lower):
+        mask |= DEVICE_KEYWORD_BIT[m.group(1)]
+    if not mask:
+        return 'unknown_devices'
+    # Lowest set bit = highest-priority matching category
+    return DEVICE_BIT_CATEGORY[mask & -mask]
+
+
+class _Win32Window:
+    """Lightweight window record built straight from EnumWindows (handle, title and geometry only)"""
+    
+    __slots__ = ('_hWnd', 'title', 'left', 'top', 'width', 'height', 'visible')
+    
+    def __init__(self, hwnd, title, left, top, width, height):
+        self._hWnd = hwnd
+        self.title = title
+        self.left = left
+        self.top = top
+        self.width = width
+        self.height = height
+        self.visible = True
+
+
+def _enum_win32_windows() -> list:
+    """Enumerate visible top-level windows via win32gui.EnumWindows without PyWinCtl wrappers"""
+    import win32gui
+    
+    windows = []
+    
+    def callback(hwnd, _):
+        if win32gui.IsWindowVisible(hwnd):
+            title = win32gui.GetWindowText(hwnd)
+            if title:
+                left, top, right, bottom = win32gui.GetWindowRect(hwnd)
+                windows.append(_Win32Window(hwnd, title, left, top, right - left, bottom - top))
+        return True
+    
+    win32gui.EnumWindows(callback, None)
+    return windows
+
+
+def _geom_from_box(window):
+    """Geometry from PyWinCtl/pygetwindow's box: one rect query instead of four property lookups"""
+    left, top, width, height = window.box
+    return width, height, left, top
+
+
+_geom_from_attrs = attrgetter('width', 'height', 'left', 'top')
+
+
+def _geom_probe(window):
+    """Geometry for objects whose attributes are only known per instance"""
+    try:
+        return _geom_from_box(window)
+    except AttributeError:
+        pass
+    try:
+        return _geom_from_attrs(window)
+    except AttributeError:
+        pass
+    try:
+        size = window.size
+    except AttributeError:
+        size = (0, 0)
+    try:
+        topleft = window.topleft
+    except AttributeError:
+        topleft = (0, 0)
+    return size[0], size[1], topleft[0], topleft[1]
+
+
+_WINDOW_GEOM_GETTERS = {}  # window class -> geometry getter, resolved on first sight
+
+
+def _window_geom(window):
+    """Return (width, height, left, top) for PyWinCtl/pygetwindow style window objects"""
+    getter = _WINDOW_GEOM_GETTERS.get(type(window))
+    if getter is None:
+        # Decide from the class so no window property (an OS query) runs just to pick a getter
+        cls = type(window)
+        if hasattr(cls, 'box'):
+            getter = _geom_from_box
+        elif all(hasattr(cls, name) for name in ('width', 'height', 'left', 'top')):
+            getter = _geom_from_attrs
+        else:
+            getter = _geom_probe
+        _WINDOW_GEOM_GETTERS[cls] = getter
+    return getter(window)
+
+
+_WindowView = namedtuple('_WindowView', ('title', 'width', 'height', 'left', 'top', 'visible'))
+
+
+def _window_visible(window) -> bool:
+    """Visibility of a PyWinCtl (`visible`) or pygetwindow (`isVisible`) window, queried once"""
+    visible = getattr(window, 'visible', None)
+    if visible is None:
+        visible = getattr(window, 'isVisible', True)
+    return visible
+
+
+def _window_view(window) -> _WindowView:
+    """Snapshot a window's title, geometry and visibility in one pass for capture-time checks"""
+    width, height, left, top = _window_geom(window)
+    return _WindowView(window.title, width, height, left, top, _window_visible(window))
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _any_nonzero(flat):
+        """Early-exit scan for the first non-zero byte of a contiguous uint8 buffer"""
+        for i in range(flat.size):
+            if flat[i]:
+                return True
+        return False
+    
+    @njit(cache=True)
+    def _any_nonzero_bgrx(flat):
+        """Early-exit scan over the colour bytes of a contiguous BGRX buffer (pad bytes skipped)"""
+        for i in range(flat.size):
+            if i & 3 != 3 and flat[i]:
+                return True
+        return False
+
+
+def _wait_foreground(hwnd, timeout: float = 0.3) -> bool:
+    """Poll until `hwnd` is the foreground window, returning False if `timeout` expires first"""
+    import win32gui
+    
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if win32gui.GetForegroundWindow() == hwnd:
+            return True
+        time.sleep(0.005)
+    return win32gui.GetForegroundWindow() == hwnd
+
+
+def _wait_restored(hwnd, timeout: float = 0.2) -> bool:
+    """Poll until `hwnd` is no longer minimized, returning False if `timeout` expires first"""
+    import win32gui
+    
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if not win32gui.IsIconic(hwnd):
+            return True
+        time.sleep(0.005)
+    return not win32gui.IsIconic(hwnd)
+
+
+def _is_bgrx(img) -> bool:
+    """True for an (h, w, 4) BGRX capture view that still needs _bgrx_to_frame before encoding"""
+    return isinstance(img, np.ndarray) and img.ndim == 3 and img.shape[2] == 4
+
+
+def _bgrx_to_frame(bgrx):
+    """Turn an (h, w, 4) BGRX view into something _write_png encodes.
+    
+    With OpenCV this is one contiguous BGR copy; otherwise PIL unpacks the
+    BGRX bytes straight into an RGB image, with no intermediate array.
+    """
+    if CV2_AVAILABLE:
+        return np.ascontiguousarray(bgrx[:, :, :3])
+    height, width = bgrx.shape[:2]
+    return Image.frombuffer("RGB", (width, height), bgrx, "raw", "BGRX", 0, 1)
+
+
+def _encode_png(img) -> bytes:
+    """Encode a PIL image or a frame from _bgrx_to_frame to PNG bytes at fast compression"""
+    if isinstance(img, np.ndarray) and CV2_AVAILABLE:
+        ok, encoded = cv2.imencode('.png', img, [cv2.IMWRITE_PNG_COMPRESSION, 1])
+        if not ok:
+            raise IOError("OpenCV could not encode the frame as PNG")
+        png_bytes = encoded.tobytes()
+    else:
+        if isinstance(img, np.ndarray):
+            img = Image.fromarray(img)
+        buffer = io.BytesIO()
+        img.save(buffer, format='PNG', compress_level=1)
+        png_bytes = buffer.getvalue()
+    return png_bytes
+
+
+def _write_png(img, filepath: str) -> bytes:
+    """Encode `img` to PNG and write it to `filepath`.
+    
+    The encoded bytes are also returned, so OCR can upload them without
+    reading the file back.
+    """
+    try:
+        png_bytes = _encode_png(img)
+    except IOError as e:
+        raise IOError(f"{e}: {filepath}") from e
+    with open(filepath, 'wb') as image_file:
+        image_file.write(png_bytes)
+    return png_bytes
+
+
+# Minimum spacing between status/progress label repaints; bursts collapse to the latest value
+UI_UPDATE_MIN_INTERVAL_SECS = 0.05
+
+# Batched screenshot deletion: flush once this many are queued, or on this interval
+DELETE_BATCH_SIZE = 64
+DELETE_FLUSH_INTERVAL_SECS = 2.0
+
+AUTO_CSV_HEADER = b"timestamp,window_title,raw_text\r\n"
+
+
+def _csv_line(*fields: str) -> bytes:
+    """Format one fully quoted CSV row (csv-module compatible) ready for a single os.write"""
+    return (','.join('"' + field.replace('"', '""') + '"' for field in fields) + '\r\n').encode('utf-8')
+
+
+def _ocr_payload(img, png_bytes: Optional[bytes], max_dimension: Optional[int]):
+    """Pick the OCR upload for a capture, returning (bytes, scale).
+    
+    With `max_dimension` set, captures larger than it are resized (area averaging)
+    and sent as JPEG; OCR coordinates then need dividing by `scale`. Pass
+    `png_bytes=None` for a capture that was never written, and the PNG is only
+    encoded if it is actually the upload.
+    """
+    if isinstance(img, np.ndarray):
+        height, width = img.shape[:2]
+    else:
+        width, height = img.size
+    scale = min(1.0, max_dimension / max(width, height)) if max_dimension else 1.0
+    if scale >= 1.0:
+        return (png_bytes if png_bytes is not None else _encode_png(img)), 1.0
+    
+    size = (max(1, int(width * scale)), max(1, int(height * scale)))
+    if isinstance(img, np.ndarray) and CV2_AVAILABLE:
+        small = cv2.resize(img, size, interpolation=cv2.INTER_AREA)
+        ok, encoded = cv2.imencode('.jpg', small, [cv2.IMWRITE_JPEG_QUALITY, 85])
+        if ok:
+            return encoded.tobytes(), scale
+        return (png_bytes if png_bytes is not None else _encode_png(img)), 1.0
+    if isinstance(img, np.ndarray):
+        img = Image.fromarray(img)
+    buffer = io.BytesIO()
+    img.convert('RGB').resize(size, Image.BOX).save(buffer, format='JPEG', quality=85)
+    return buffer.getvalue(), scale
+
+
+def _encode_capture(img, filepath: Optional[str], ocr_max_dimension: Optional[int] = None):
+    """Save a capture as PNG (unless `filepath` is None) and return its OCR upload as (bytes, scale)"""
+    if _is_bgrx(img):
+        img = _bgrx_to_frame(img)
+    png_bytes = _write_png(img, filepath) if filepath is not None else None
+    return _ocr_payload(img, png_bytes, ocr_max_dimension)
+
+
+def _ocr_lines_analyze_read(ocr_result: dict) -> list:
+    """Document Intelligence / Read API v3.2+ format (analyzeResult.readResults)"""
+    return [line.get('text', '') for page in ocr_result['analyzeResult']['readResults']
+            for line in page.get('lines', [])]
+
+
+def _ocr_lines_analyze_pages(ocr_result: dict) -> list:
+    """Document Intelligence format with analyzeResult.pages"""
+    return [line.get('text', '') for page in ocr_result['analyzeResult']['pages']
+            for line in page.get('lines', [])]
+
+
+def _ocr_lines_read_result(ocr_result: dict) -> list:
+    """Read API v3.0/3.1 format"""
+    return [line.get('text', '') for page in ocr_result['readResult']['pages']
+            for line in page.get('lines', [])]
+
+
+def _ocr_lines_regions(ocr_result: dict) -> list:
+    """OCR API v3.2 format (this is what we're actually using): join the words of each line"""
+    raw_text_lines = []
+    for region in ocr_result['regions']:
+        for line in region.get('lines', []):
+            line_text = ' '.join([word.get('text', '') for word in line.get('words', [])])
+            if line_text.strip():
+                raw_text_lines.append(line_text)
+    return raw_text_lines
+
+
+def _ocr_lines_any(ocr_result: dict) -> list:
+    """Fallback: walk the whole response for any 'text' fields (explicit stack, document order)"""
+    raw_text_lines = []
+    text_keys = frozenset(('text', 'content'))
+    stack = [ocr_result]
+    while stack:
+        obj = stack.pop()
+        obj_type = type(obj)
+        if obj_type is dict:
+            # Look for 'text' field, then 'content' (alternative text field)
+            value = obj.get('text')
+            if type(value) is not str or not value.strip():
+                value = obj.get('content')
+            if type(value) is str and value.strip():
+                raw_text_lines.append(value)
+            # Queue nested objects, reversed so they pop in their original order
+            stack.extend(reversed([v for k, v in obj.items() if k not in text_keys]))
+        elif obj_type is list:
+            stack.extend(reversed(obj))
+    return raw_text_lines
+
+
+def _ocr_lines_none(ocr_result: dict) -> list:
+    """analyzeResult without readResults or pages carries no text"""
+    return []
+
+
+def _detect_ocr_extractor(ocr_result: dict):
+    """Pick the line extractor for an Azure OCR response by its shape"""
+    if 'analyzeResult' in ocr_result:
+        analyze_result = ocr_result['analyzeResult']
+        if 'readResults' in analyze_result:
+            return _ocr_lines_analyze_read
+        if 'pages' in analyze_result:
+            return _ocr_lines_analyze_pages
+        return _ocr_lines_none
+    if 'readResult' in ocr_result:
+        return _ocr_lines_read_result
+    if 'regions' in ocr_result:
+        return _ocr_lines_regions
+    return _ocr_lines_any
+
+
+def _write_json(json_path: str, data) -> None:
+    """Write `data` as indented UTF-8 JSON, serialized with orjson when it is installed"""
+    if ORJSON_AVAILABLE:
+        payload = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    else:
+        payload = json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+    with open(json_path, 'wb') as json_file:
+        json_file.write(payload)
+
+
+def _write_auto_records(csv_fd: int, csv_line: bytes, json_path: Optional[str] = None,
+                        export_data: Optional[dict] = None):
+    """Append one pre-formatted auto-capture row to the open CSV and write its JSON export"""
+    os.write(csv_fd, csv_line)
+    if json_path:
+        _write_json(json_path, export_data)
+
+
+def _is_blank(img) -> bool:
+    """Return True if every pixel of the image is zero (all-black capture)"""
+    arr = np.asarray(img)
+    if _is_bgrx(arr):
+        # Raw capture view: ignore the pad byte, which may be 0 or 255
+        if NUMBA_AVAILABLE and arr.dtype == np.uint8 and arr.flags.c_contiguous:
+            return not _any_nonzero_bgrx(arr.reshape(-1))
+        return not arr[:, :, :3].any()
+    if NUMBA_AVAILABLE and arr.dtype == np.uint8:
+        return not _any_nonzero(np.ascontiguousarray(arr).reshape(-1))
+    return not arr.any()
+
+
+# Where the resolved app icon path is remembered between launches
+# One cache file per install: keyed on the interpreter/executable and this script's location
+ICON_PATH_CACHE = os.path.join(tempfile.gettempdir(), 'grace_iconpath_' + hashlib.sha1(
+    f"{sys.executable}|{os.path.abspath(__file__)}".encode('utf-8')).hexdigest()[:16])
+_ICON_PATH = None  # Resolved this run: path, '' if none was found, None if not looked up yet
+
+
+def _icon_candidates() -> tuple:
+    """Icon locations to try, ICO before PNG and the PyInstaller bundle first on frozen runs"""
+    icon_dirs = []
+    if hasattr(sys, '_MEIPASS'):
+        icon_dirs.append(sys._MEIPASS)  # PyInstaller bundle
+    if getattr(sys, 'frozen', False):
+        icon_dirs.append(os.path.dirname(sys.executable))  # Frozen executable directory
+    icon_dirs.append('')  # Current directory
+    icon_dirs.append(os.path.dirname(os.path.abspath(__file__)))  # Script directory
+    return tuple(os.path.join(icon_dir, icon_file)
+                 for icon_file in ("app_icon.ico", "app_icon.png") for icon_dir in icon_dirs)
+
+
+def _in_pyinstaller_bundle(path: str) -> bool:
+    """True for paths inside this run's PyInstaller extraction directory (gone after exit)"""
+    bundle_dir = getattr(sys, '_MEIPASS', None)
+    if not bundle_dir:
+        return False
+    bundle_dir = os.path.abspath(bundle_dir)
+    return os.path.commonpath([bundle_dir, os.path.abspath(path)]) == bundle_dir
+
+
+def _resolve_icon_path() -> Optional[str]:
+    """Find the app icon once per run, trusting the path cached by a previous launch if it still exists"""
+    global _ICON_PATH
+    if _ICON_PATH is not None:
+        return _ICON_PATH or None
+    
+    try:
+        with open(ICON_PATH_CACHE, encoding='utf-8') as cache_file:
+            cached_path = cache_file.read().strip()
+        if cached_path and os.path.isfile(cached_path):
+            _ICON_PATH = cached_path
+            return cached_path
+    except OSError:
+        pass  # First launch (or unreadable cache): scan the candidates
+    
+    _ICON_PATH = ''
+    for icon_path in _icon_candidates():
+        if os.path.isfile(icon_path) and not QIcon(icon_path).isNull():
+            _ICON_PATH = os.path.abspath(icon_path)
+            if _in_pyinstaller_bundle(_ICON_PATH):
+                break  # A onefile build extracts to a fresh directory each launch; nothing to reuse
+            try:
+                with open(ICON_PATH_CACHE, 'w', encoding='utf-8') as cache_file:
+                    cache_file.write(_ICON_PATH)
+            except OSError as e:
+                print(f"DEBUG: Could not cache icon path: {e}")
+            break
+    return _ICON_PATH or None
+
 
 class InstantDeviceDialog(QDialog):
     """Dialog window to display ALL devices instantly in a simple list"""
@@ -252,27 +750,20 @@ class InstantDeviceDialog(QDialog):
             name_item.setFont(QFont("Arial", 10, QFont.Bold))
             self.device_table.setItem(i, 1, name_item)
             
-            # Size - Use cross-platform attribute checking
+            # Size and position - Use cross-platform attribute checking (one geometry query)
             try:
-                width = getattr(window, 'width', getattr(window, 'size', [0, 0])[0] if hasattr(window, 'size') else 0)
-                height = getattr(window, 'height', getattr(window, 'size', [0, 0])[1] if hasattr(window, 'size') else 0)
+                width, height, left, top = _window_geom(window)
                 size_text = f"{width} x {height}"
-            except:
-                size_text = "Unknown"
-            self.device_table.setItem(i, 2, QTableWidgetItem(size_text))
-            
-            # Position - Use cross-platform attribute checking
-            try:
-                left = getattr(window, 'left', getattr(window, 'topleft', [0, 0])[0] if hasattr(window, 'topleft') else 0)
-                top = getattr(window, 'top', getattr(window, 'topleft', [0, 0])[1] if hasattr(window, 'topleft') else 0)
                 pos_text = f"({left}, {top})"
             except:
+                size_text = "Unknown"
                 pos_text = "Unknown"
+            self.device_table.setItem(i, 2, QTableWidgetItem(size_text))
             self.device_table.setItem(i, 3, QTableWidgetItem(pos_text))
             
             # Visible status - Use cross-platform attribute checking
             try:
-                visible = getattr(window, 'visible', getattr(window, 'isVisible', True))
+                visible = _window_visible(window)
                 visible_text = "✅ Yes" if visible else "❌ No"
                 visible_item = QTableWidgetItem(visible_text)
                 if visible:
@@ -351,23 +842,17 @@ class InstantDeviceDialog(QDialog):
                 
                 # Handle potential attribute differences between PyWinCtl and pygetwindow
                 try:
-                    width = getattr(window, 'width', getattr(window, 'size', [0, 0])[0] if hasattr(window, 'size') else 0)
-                    height = getattr(window, 'height', getattr(window, 'size', [0, 0])[1] if hasattr(window, 'size') else 0)
+                    width, height, left, top = _window_geom(window)
                     size_text = f"{width} x {height}"
-                except:
-                    size_text = "Unknown"
-                self.device_table.setItem(i, 2, QTableWidgetItem(size_text))
-                
-                try:
-                    left = getattr(window, 'left', getattr(window, 'topleft', [0, 0])[0] if hasattr(window, 'topleft') else 0)
-                    top = getattr(window, 'top', getattr(window, 'topleft', [0, 0])[1] if hasattr(window, 'topleft') else 0)
                     pos_text = f"({left}, {top})"
                 except:
+                    size_text = "Unknown"
                     pos_text = "Unknown"
+                self.device_table.setItem(i, 2, QTableWidgetItem(size_text))
                 self.device_table.setItem(i, 3, QTableWidgetItem(pos_text))
                 
                 try:
-                    visible = getattr(window, 'visible', getattr(window, 'isVisible', True))
+                    visible = _window_visible(window)
                     visible_text = "✅ Yes" if visible else "❌ No"
                     visible_item = QTableWidgetItem(visible_text)
                     if visible:
@@ -495,41 +980,72 @@ class DeviceDiscoveryDialog(QDialog):
                 tips_item.addChild(tip_item)
 
 
+_OCR_SESSION = None
+
+
+def _ocr_session():
+    """Shared HTTP session for OCR calls, so keep-alive connections are reused across captures"""
+    global _OCR_SESSION
+    if _OCR_SESSION is None:
+        _OCR_SESSION = requests.Session()
+    return _OCR_SESSION
+
+
+def _post_ocr(image_path: str, api_key: str, endpoint: str, pending_save=None,
+              ocr_max_dimension: Optional[int] = None):
+    """Upload one capture to Azure OCR, returning (response, scale of the uploaded image)"""
+    # Azure Computer Vision OCR API call
+    headers = {
+        'Ocp-Apim-Subscription-Key': api_key,
+        'Content-Type': 'application/octet-stream'
+    }
+    
+    # Take the PNG bytes straight from a background encode still in flight (waiting
+    # off the GUI thread); otherwise read the finished file from disk
+    ocr_scale = 1.0
+    if pending_save is not None:
+        image_data, ocr_scale = pending_save.result()
+    else:
+        with open(image_path, 'rb') as image_file:
+            image_data = image_file.read()
+        if ocr_max_dimension:
+            with Image.open(io.BytesIO(image_data)) as img:
+                image_data, ocr_scale = _ocr_payload(img, image_data, ocr_max_dimension)
+    
+    response = _ocr_session().post(
+        f"{endpoint}/vision/v3.2/ocr",
+        headers=headers,
+        data=image_data,
+        params={'language': OCR_LANGUAGE, 'detectOrientation': str(DETECT_ORIENTATION).lower()}
+    )
+    return response, ocr_scale
+
+
 class OCRWorker(QThread):
     """Worker thread for OCR processing to avoid blocking the UI"""
-    finished = pyqtSignal(dict)
+    finished = pyqtSignal(dict, float)  # OCR result, OCR scale (uploaded size / saved size)
     error = pyqtSignal(str)
     
-    def __init__(self, image_path: str, api_key: str, endpoint: str):
+    def __init__(self, image_path: str, api_key: str, endpoint: str, pending_save=None,
+                 ocr_max_dimension: Optional[int] = None):
         super().__init__()
         self.image_path = image_path
         self.api_key = api_key
         self.endpoint = endpoint
+        self.pending_save = pending_save  # Future of a background encode of image_path: (OCR bytes, scale)
+        self.ocr_max_dimension = ocr_max_dimension  # Downscale limit for uploads read from disk
     
     def run(self):
         try:
             if not requests:
                 self.error.emit("requests library not installed. Please install: pip install requests")
                 return
-                
-            # Azure Computer Vision OCR API call
-            headers = {
-                'Ocp-Apim-Subscription-Key': self.api_key,
-                'Content-Type': 'application/octet-stream'
-            }
-            
-            with open(self.image_path, 'rb') as image_file:
-                image_data = image_file.read()
             
-            response = requests.post(
-                f"{self.endpoint}/vision/v3.2/ocr",
-                headers=headers,
-                data=image_data,
-                params={'language': OCR_LANGUAGE, 'detectOrientation': str(DETECT_ORIENTATION).lower()}
-            )
+            response, ocr_scale = _post_ocr(self.image_path, self.api_key, self.endpoint,
+                                            self.pending_save, self.ocr_max_dimension)
             
             if response.status_code == 200:
-                self.finished.emit(response.json())
+                self.finished.emit(response.json(), ocr_scale)
             else:
                 self.error.emit(f"OCR API Error: {response.status_code} - {response.text}")
                 
@@ -537,6 +1053,126 @@ class OCRWorker(QThread):
             self.error.emit(f"OCR processing failed: {str(e)}")
 
 
+class OCRTaskSignals(QObject):
+    """Signals shared by every OCRTask (QRunnable can't declare its own)"""
+    finished = pyqtSignal(dict, str, float)  # OCR result, image path, OCR scale
+    error = pyqtSignal(str)
+
+
+class OCRTask(QRunnable):
+    """OCR job for the app's QThreadPool; releases its backlog slot when done"""
+    
+    def __init__(self, signals: OCRTaskSignals, slots: QSemaphore, image_path: str, api_key: str,
+                 endpoint: str, pending_save=None, ocr_max_dimension: Optional[int] = None):
+        super().__init__()
+        self.signals = signals
+        self.slots = slots
+        self.image_path = image_path
+        self.api_key = api_key
+        self.endpoint = endpoint
+        self.pending_save = pending_save
+        self.ocr_max_dimension = ocr_max_dimension
+    
+    def run(self):
+        try:
+            if not requests:
+                self.signals.error.emit("requests library not installed. Please install: pip install requests")
+                return
+            
+            response, ocr_scale = _post_ocr(self.image_path, self.api_key, self.endpoint,
+                                            self.pending_save, self.ocr_max_dimension)
+            
+            if response.status_code == 200:
+                self.signals.finished.emit(response.json(), self.image_path, ocr_scale)
+            else:
+                self.signals.error.emit(f"OCR API Error: {response.status_code} - {response.text}")
+                
+        except Exception as e:
+            self.signals.error.emit(f"OCR processing failed: {str(e)}")
+        finally:
+            self.slots.release()
+
+
+class BatchOCRWorker(QThread):
+    """Worker thread that OCRs several captures with one request per vertically stacked batch"""
+    finished = pyqtSignal(list)  # [(image_path, per-frame OCR result, upload scale), ...]
+    error = pyqtSignal(str)
+    
+    def __init__(self, image_paths: list, api_key: str, endpoint: str, pending_saves: list,
+                 max_dimension: int = None):
+        super().__init__()
+        self.image_paths = image_paths
+        self.api_key = api_key
+        self.endpoint = endpoint
+        self.pending_saves = pending_saves  # In-flight encode futures (or None) per image path
+        self.max_dimension = max_dimension  # OCR downscale limit per frame (None = off)
+    
+    def run(self):
+        try:
+            if not requests:
+                self.error.emit("requests library not installed. Please install: pip install requests")
+                return
+            
+            # Wait (off the GUI thread) for every screenshot to be on disk
+            for pending_save in self.pending_saves:
+                if pending_save is not None:
+                    pending_save.result()
+            
+            frames = []
+            for image_path in self.image_paths:
+                with Image.open(image_path) as img:
+                    frames.append(img.convert('RGB'))
+            
+            # Group consecutive frames so each stacked upload stays within the OCR size limits
+            groups, scales = plan_ocr_batches([frame.size for frame in frames],
+                                              max_dimension=self.max_dimension)
+            
+            def stack_frames(indices):
+                """Stack the (resized) frames into one JPEG, returning its bytes"""
+                sizes = [(scaled_length(frames[index].width, scales[index]),
+                          scaled_length(frames[index].height, scales[index])) for index in indices]
+                canvas = Image.new('RGB', (max(w for w, _ in sizes), sum(h for _, h in sizes)))
+                top = 0
+                for index, size in zip(indices, sizes):
+                    frame = frames[index]
+                    canvas.paste(frame if size == frame.size else frame.resize(size, Image.BOX), (0, top))
+                    top += size[1]
+                buffer = io.BytesIO()
+                canvas.save(buffer, format='JPEG', quality=90)
+                return buffer.getvalue()
+            
+            headers = {
+                'Ocp-Apim-Subscription-Key': self.api_key,
+                'Content-Type': 'application/octet-stream'
+            }
+            results = []
+            for group in groups:
+                for indices, payload in split_to_fit(group, stack_frames):
+                    band_tops, top = [], 0
+                    for index in indices:
+                        band_tops.append(top)
+                        top += scaled_length(frames[index].height, scales[index])
+                    
+                    response = _ocr_session().post(
+                        f"{self.endpoint}/vision/v3.2/ocr",
+                        headers=headers,
+                        data=payload,
+                        params={'language': OCR_LANGUAGE, 'detectOrientation': str(DETECT_ORIENTATION).lower()}
+                    )
+                    if response.status_code != 200:
+                        self.error.emit(f"OCR API Error: {response.status_code} - {response.text}")
+                        return
+                    
+                    frame_results = split_ocr_regions(response.json(), band_tops)
+                    results.extend((self.image_paths[index], frame_result, scales[index])
+                                   for index, frame_result in zip(indices, frame_results))
+            
+            self.finished.emit(results)
+                
+        except Exception as e:
+            self.error.emit(f"Batch OCR processing failed: {str(e)}")
+
+
 class HelpDocumentationDialog(QDialog):
     """Comprehensive help and documentation dialog"""
     
@@ -1011,6 +1647,10 @@ AZURE_ENDPOINT=https://your-resource-name.cognitiveservices.azure.com/
 # OCR Settings
 OCR_LANGUAGE=en
 DETECT_ORIENTATION=true
+OCR_DOWNSCALE_ENABLED=true
+OCR_MAX_DIMENSION=1600
+OCR_BATCH_SIZE=1
+OCR_BATCH_WINDOW_SECS=30
 
 # Application Settings
 SCREENSHOTS_FOLDER=screenshots
@@ -1057,6 +1697,10 @@ project/
         <ul>
             <li><b>OCR_LANGUAGE:</b> Language code for text recognition (en, es, fr, etc.)</li>
             <li><b>DETECT_ORIENTATION:</b> Enable automatic text orientation detection</li>
+            <li><b>OCR_DOWNSCALE_ENABLED:</b> Upload large captures to OCR as a downscaled JPEG</li>
+            <li><b>OCR_MAX_DIMENSION:</b> Longest side (pixels) of the image sent to OCR when downscaling</li>
+            <li><b>OCR_BATCH_SIZE:</b> Auto-captures combined into one OCR request (1 = no batching)</li>
+            <li><b>OCR_BATCH_WINDOW_SECS:</b> Longest wait before a partial batch is sent</li>
         </ul>
         
         <h4>🎨 UI Settings</h4>
@@ -1148,6 +1792,9 @@ class USBStabilityManager:
         self.current_operations = 0
         self.error_count = 0
         self.last_error_time = 0
+        # Cleared while a file operation has just failed, set again once one succeeds
+        self.settled = threading.Event()
+        self.settled.set()
         
     def enable_stability_mode(self):
         """Enable maximum USB stability mode"""
@@ -1194,11 +1841,13 @@ class USBStabilityManager:
                 time.sleep(self.operation_delays.get(operation_type, 0.2) * 0.5)
             
             self.error_count = 0  # Reset error count on success
+            self.settled.set()
             return result
             
         except Exception as e:
             self.error_count += 1
             self.last_error_time = time.time()
+            self.settled.clear()
             print(f"DEBUG: USB Stability - Operation failed: {operation_type}, Error: {e}")
             
             # Auto-enable stability mode if errors occur
@@ -1211,6 +1860,10 @@ class USBStabilityManager:
         finally:
             self.current_operations = max(0, self.current_operations - 1)
             
+    def wait_settled(self, operation_type):
+        """Hold off only while a recent USB disturbance is unresolved, at most the operation's delay"""
+        return self.settled.wait(timeout=self.operation_delays.get(operation_type, 0.2))
+        
     def safe_file_write(self, file_path, content, mode='w', encoding='utf-8'):
         """Safely write to file with USB stability"""
         def write_operation():
@@ -1224,16 +1877,6 @@ class USBStabilityManager:
                 
         return self.safe_file_operation('file_write', write_operation)
         
-    def safe_file_delete(self, file_path):
-        """Safely delete file with USB stability"""
-        def delete_operation():
-            if os.path.exists(file_path):
-                os.remove(file_path)
-                return True
-            return False
-            
-        return self.safe_file_operation('file_delete', delete_operation)
-        
     def safe_cleanup(self, cleanup_func, *args, **kwargs):
         """Safely perform cleanup operations"""
         return self.safe_file_operation('cleanup', cleanup_func, *args, **kwargs)
@@ -1581,7 +2224,7 @@ class SettingsDialog(QDialog):
                 self.avg_time_label.setText("⚡ Avg Processing: 0.0s")
             
             # Update session uptime
-            uptime_seconds = int(time.time() - self.parent_app.session_start_time)
+            uptime_seconds = int(time.monotonic() - self.parent_app.session_start_time)
             hours = uptime_seconds // 3600
             minutes = (uptime_seconds % 3600) // 60
             seconds = uptime_seconds % 60
@@ -1747,6 +2390,62 @@ class BiosensorApp(QMainWindow):
         last_ocr_result (dict): Cache of most recent OCR result for export
     """
     
+    # OCR result label: one stylesheet parsed once, states switched through the "state" property
+    _OCR_STATUS_QSS = """
+        QLabel[state="empty"] {
+            color: #888;
+            padding: 20px;
+            text-align: center;
+            background: rgba(255, 255, 255, 0.05);
+            border: 2px dashed #555;
+            border-radius: 8px;
+            margin: 10px;
+        }
+        
+        QLabel[state="ok"] {
+            color: #4CAF50;
+            padding: 15px;
+            background: rgba(76, 175, 80, 0.1);
+            border: 2px solid #4CAF50;
+            border-radius: 8px;
+            margin: 10px;
+        }
+        
+        QLabel[state="no_text"] {
+            color: #FF9800;
+            padding: 15px;
+            background: rgba(255, 152, 0, 0.1);
+            border: 2px solid #FF9800;
+            border-radius: 8px;
+            margin: 10px;
+        }
+        
+        QLabel[state="config"] {
+            color: #FF5722;
+            padding: 15px;
+            background: rgba(255, 87, 34, 0.1);
+            border: 2px solid #FF5722;
+            border-radius: 8px;
+            margin: 10px;
+        }
+        
+        QLabel[state="error"] {
+            color: #F44336;
+            padding: 15px;
+            background: rgba(244, 67, 54, 0.1);
+            border: 2px solid #F44336;
+            border-radius: 8px;
+            margin: 10px;
+        }
+    """
+    
+    # Emitted by the delete worker thread with the number of screenshots unlinked in a batch
+    screenshots_deleted = pyqtSignal(int)
+    # Emitted from the writer thread when a JSON export finishes: (path, error message or '')
+    json_export_finished = pyqtSignal(str, str)
+    # Emitted from the writer thread when a queued auto-save (CSV row + JSON) fails: error message
+    auto_save_failed = pyqtSignal(str)
+    
     def __init__(self):
         super().__init__()
         self.setWindowTitle("🔬 Grace Biosensor Data Capture - Professional Edition")
@@ -1774,6 +2473,29 @@ class BiosensorApp(QMainWindow):
         os.makedirs(self.json_dir, exist_ok=True)
         os.makedirs(self.csv_dir, exist_ok=True)
         
+        # Screenshot subdirectories are created once here instead of on every capture
+        self.auto_images_dir = os.path.join(self.screenshots_dir, "auto_captures")
+        self.manual_images_dir = os.path.join(self.screenshots_dir, "manual_captures")
+        os.makedirs(self.auto_images_dir, exist_ok=True)
+        os.makedirs(self.manual_images_dir, exist_ok=True)
+        
+        # Export locations, likewise resolved and created once
+        self.auto_csv_path = os.path.join(self.csv_dir, "auto_data.csv")
+        self.manual_csv_dir = os.path.join(self.csv_dir, "manual_captures")
+        self.manual_json_dir = os.path.join(self.json_dir, "manual_captures")
+        os.makedirs(self.manual_csv_dir, exist_ok=True)
+        os.makedirs(self.manual_json_dir, exist_ok=True)
+        
+        # Capture sequence number, appended to the nanosecond timestamp so filenames stay
+        # unique even when the system clock is coarser than the capture rate
+        self._shot_seq = itertools.count()
+        
+        # Capture screenshots on disk as a min-heap of (mtime, path), scanned once at startup;
+        # paths removed elsewhere drop out of the live set and are skipped lazily when popped
+        self._screenshot_heap = []
+        self._screenshot_paths = set()
+        self._seed_screenshot_heap()
+        
         # Timer for auto-capture
         self.auto_timer = QTimer()
         self.auto_timer.timeout.connect(self.auto_capture)
@@ -1791,14 +2513,84 @@ class BiosensorApp(QMainWindow):
         # Store last known device count for change detection
         self.last_device_count = 0
         
+        # Memoized device discovery (keyed by hash of current window titles)
+        self._last_devices_hash = None
+        self._last_devices_result = None
+        
+        # Short-lived snapshot of the OS window list: (monotonic timestamp, windows, {title: window})
+        self._window_cache = (0.0, None, {})
+        
+        # One reusable QMessageBox per severity for capture/export messages (created on first use)
+        self._message_boxes = {}
+        
+        # Window object behind the current combo selection (validated once per selection)
+        self._selected_window_cache = None
+        
+        # Long-lived MSS screen grabbers, one per capturing thread (MSS handles are thread-bound)
+        self._mss_local = threading.local()
+        self._mss_instances = []
+        
+        # Shared libxdo context for Linux window activation (created lazily)
+        self._xdo = None
+        
+        # Long-lived DXcam camera so Desktop Duplication is set up once (created lazily)
+        self._dxcam = None
+        
+        # Shared X11 display connection for Linux region grabs (opened lazily)
+        self._xdisplay = None
+        
+        # scrot is only kept as a capture fallback if in-process grabbing is unusable at startup
+        self._scrot_fallback = PLATFORM == 'linux' and self._probe_scrot_fallback()
+        
+        # Background PNG encoding so captures don't wait on compression
+        self._encode_pool = ThreadPoolExecutor(max_workers=2)
+        self._pending_saves = {}  # filepath -> Future of the in-flight save
+        self._unsaved_captures = set()  # Capture paths OCR'd from memory, never written to disk
+        
+        # auto_data.csv stays open for appends for the whole session (opened on first write)
+        self._auto_csv_fd = None
+        
+        # Single writer thread so queued CSV/JSON records land in capture order (Linux auto-save)
+        self._io_pool = ThreadPoolExecutor(max_workers=1)
+        
+        # Runs the MSS grab speculatively while PrintWindow is tried (Windows background capture);
+        # at most one speculative grab is in flight at a time
+        self._capture_pool = ThreadPoolExecutor(max_workers=1)
+        self._mss_speculation = None
+        
+        # Auto-deleted screenshots are unlinked in batches by a background worker
+        self._pending_deletes = deque(maxlen=4096)
+        self._delete_wakeup = threading.Event()
+        self._delete_stop = False
+        self.screenshots_deleted.connect(self.on_screenshots_deleted)
+        self.json_export_finished.connect(self.on_json_exported)
+        self.auto_save_failed.connect(self.on_auto_save_failed)
+        self._delete_worker = threading.Thread(target=self._delete_worker_loop,
+                                               name="screenshot-delete", daemon=True)
+        self._delete_worker.start()
+        
         # OCR worker thread
         self.ocr_worker = None
         
+        # Capture OCR runs on one pooled thread; at most two jobs may be pending at once
+        self._ocr_pool = QThreadPool()
+        self._ocr_pool.setMaxThreadCount(1)
+        self._ocr_slots = QSemaphore(2)
+        self._ocr_signals = OCRTaskSignals()
+        self._ocr_signals.finished.connect(self.on_ocr_task_finished)
+        self._ocr_signals.error.connect(self.on_ocr_error)
+        
         # Navigation Alert System
         self.task_queue = []
         self.current_task = None
         self.task_progress = 0
         
+        # Status/progress label updates are coalesced: only the latest pending one is painted
+        self._pending_status = None  # (message, color)
+        self._pending_progress = None  # (progress, message)
+        self._ui_flush_scheduled = False
+        self._last_ui_flush = 0.0
+        
         # Azure OCR settings from config
         self.azure_api_key = AZURE_API_KEY
         self.azure_endpoint = AZURE_ENDPOINT
@@ -1806,9 +2598,28 @@ class BiosensorApp(QMainWindow):
         # Store last OCR result for manual export
         self.last_ocr_result = None
         
+        # Line extractor for the response shape the OCR endpoint returns (picked on first result)
+        self._ocr_extractor = None
+        
+        # Send large captures to OCR downscaled (saved screenshots stay full size)
+        self.ocr_downscale_enabled = OCR_DOWNSCALE_ENABLED
+        self.ocr_max_dimension = OCR_MAX_DIMENSION
+        
+        # Auto-capture OCR batching: captures wait here until the batch is full or its timer fires
+        self.ocr_batch_size = OCR_BATCH_SIZE
+        if self.ocr_batch_size > 1 and DETECT_ORIENTATION:
+            # Orientation is detected per request, so a stacked batch would get one guess for all
+            print("DEBUG: OCR batching disabled because DETECT_ORIENTATION is on")
+            self.ocr_batch_size = 1
+        self._ocr_batch = []
+        self._ocr_batch_worker = None
+        self._ocr_batch_timer = QTimer()
+        self._ocr_batch_timer.setSingleShot(True)
+        self._ocr_batch_timer.timeout.connect(self.flush_ocr_batch)
+        
         # Performance tracking variables
-        self.auto_capture_times = []  # List of processing times for auto captures
-        self.manual_capture_times = []  # List of processing times for manual captures
+        self.auto_capture_times = deque(maxlen=50)  # Last 50 processing times for auto captures
+        self.manual_capture_times = deque(maxlen=50)  # Last 50 processing times for manual captures
         self.api_latency_times = []  # List of API response times
         self.total_captures = 0
         self.auto_captures = 0
@@ -1816,7 +2627,7 @@ class BiosensorApp(QMainWindow):
         self.total_processing_time = 0.0
         self.auto_processing_time = 0.0
         self.manual_processing_time = 0.0
-        self.session_start_time = time.time()
+        self.session_start_time = time.monotonic()
         self.last_capture_time = None
         self.last_api_time = None
         
@@ -1836,52 +2647,27 @@ class BiosensorApp(QMainWindow):
         self.usb_stability_manager = USBStabilityManager(self)
         
         self.init_ui()
+        
+        # apply_zoom appends a root font-size rule to the application's own stylesheet
+        self._base_stylesheet = QApplication.instance().styleSheet()
+        self._zoom_apply_pending = False
     
     def set_app_icon(self):
         """Set the application icon - Compatible with PyInstaller"""
         try:
-            # Multiple paths to check for the icon (prefer ICO for Windows)
-            icon_files = ["app_icon.ico", "app_icon.png"]  # Prefer ICO over PNG
-            icon_paths = []
-            
-            for icon_file in icon_files:
-                paths = [
-                    icon_file,  # Current directory
-                    os.path.join(os.path.dirname(os.path.abspath(__file__)), icon_file),  # Script directory
-                    os.path.join(sys._MEIPASS, icon_file) if hasattr(sys, '_MEIPASS') else None,  # PyInstaller bundle
-                    os.path.join(os.path.dirname(sys.executable), icon_file) if getattr(sys, 'frozen', False) else None,  # Frozen executable directory
-                ]
-                icon_paths.extend([p for p in paths if p is not None])
-            
-            # Remove None entries
-            icon_paths = [path for path in icon_paths if path is not None]
-            
-            icon_loaded = False
-            for icon_path in icon_paths:
-                if os.path.exists(icon_path):
-                    try:
-                        # Set the window icon
-                        icon = QIcon(icon_path)
-                        
-                        # Verify the icon is valid
-                        if not icon.isNull():
-                            self.setWindowIcon(icon)
-                            
-                            # Set the application icon (for taskbar, etc.)
-                            QApplication.instance().setWindowIcon(icon)
-                            
-                            print(f"✅ App icon loaded successfully: {icon_path}")
-                            icon_loaded = True
-                            break
-                        else:
-                            print(f"⚠️ Invalid icon file: {icon_path}")
-                    except Exception as icon_error:
-                        print(f"⚠️ Error loading icon from {icon_path}: {icon_error}")
-                        continue
-            
-            if not icon_loaded:
+            icon_path = _resolve_icon_path()
+            if icon_path:
+                # Set the window icon
+                icon = QIcon(icon_path)
+                self.setWindowIcon(icon)
+                
+                # Set the application icon (for taskbar, etc.)
+                QApplication.instance().setWindowIcon(icon)
+                
+                print(f"✅ App icon loaded successfully: {icon_path}")
+            else:
                 print("⚠️ App icon not found in any of the expected locations:")
-                for path in icon_paths:
+                for path in _icon_candidates():
                     print(f"  - {path}")
                 print("📝 Using default system icon")
                 
@@ -2354,6 +3140,7 @@ class BiosensorApp(QMainWindow):
         
         self.window_combo = QComboBox()
         self.window_combo.setMinimumWidth(300)
+        self.window_combo.currentIndexChanged.connect(self._invalidate_selected_window)
         window_select_layout.addWidget(self.window_combo)
         
         self.refresh_btn = QPushButton("🔄 Refresh")
@@ -2657,17 +3444,8 @@ class BiosensorApp(QMainWindow):
         # Status display for last OCR result
         self.ocr_status_label = QLabel("No OCR results yet. Capture a window to see results.")
         self.ocr_status_label.setFont(QFont("Arial", 11))
-        self.ocr_status_label.setStyleSheet("""
-            QLabel {
-                color: #888;
-                padding: 20px;
-                text-align: center;
-                background: rgba(255, 255, 255, 0.05);
-                border: 2px dashed #555;
-                border-radius: 8px;
-                margin: 10px;
-            }
-        """)
+        self.ocr_status_label.setProperty("state", "empty")
+        self.ocr_status_label.setStyleSheet(self._OCR_STATUS_QSS)
         self.ocr_status_label.setAlignment(Qt.AlignCenter)
         results_layout.addWidget(self.ocr_status_label)
         
@@ -2970,11 +3748,11 @@ class BiosensorApp(QMainWindow):
             test_path = os.path.join(self.screenshots_dir, 'settings_ocr_test.png')
             test_image.save(test_path)
             
-            start_time = time.time()
+            start_time = time.perf_counter()
             
             # Create OCR worker for estimation
             self.settings_ocr_worker = OCRWorker(test_path, self.azure_api_key, self.azure_endpoint)
-            self.settings_ocr_worker.finished.connect(lambda result: self.on_ocr_estimation_finished(result, settings_dialog, start_time))
+            self.settings_ocr_worker.finished.connect(lambda result, _scale: self.on_ocr_estimation_finished(result, settings_dialog, start_time))
             self.settings_ocr_worker.error.connect(lambda error: self.on_ocr_estimation_error(error, settings_dialog))
             self.settings_ocr_worker.start()
             
@@ -3018,7 +3796,7 @@ class BiosensorApp(QMainWindow):
     def on_settings_latency_test_finished(self, result, settings_dialog, start_time):
         """Handle latency test completion from settings"""
         try:
-            latency = time.time() - start_time
+            latency = time.perf_counter() - start_time
             self.api_latency_times.append(latency)
             
             # Keep only last 10 measurements
@@ -3054,8 +3832,8 @@ class BiosensorApp(QMainWindow):
     def reset_performance_stats(self):
         """Reset all performance statistics"""
         try:
-            self.auto_capture_times = []
-            self.manual_capture_times = []
+            self.auto_capture_times.clear()
+            self.manual_capture_times.clear()
             self.api_latency_times = []
             self.total_captures = 0
             self.auto_captures = 0
@@ -3063,7 +3841,7 @@ class BiosensorApp(QMainWindow):
             self.total_processing_time = 0.0
             self.auto_processing_time = 0.0
             self.manual_processing_time = 0.0
-            self.session_start_time = time.time()
+            self.session_start_time = time.monotonic()
             self.last_capture_time = None
             self.last_api_time = None
             
@@ -3085,9 +3863,10 @@ class BiosensorApp(QMainWindow):
     
     def auto_refresh_windows(self):
         """Automatically refresh windows to detect new devices"""
+        self._invalidate_selected_window()
         try:
             # Only auto-refresh if no capture is in progress
-            if not hasattr(self, 'ocr_worker') or not self.ocr_worker or not self.ocr_worker.isRunning():
+            if not self._ocr_in_flight():
                 current_count = self.window_combo.count()
                 old_selection = self.window_combo.currentText() if self.window_combo.currentIndex() >= 0 else None
                 
@@ -3111,7 +3890,7 @@ class BiosensorApp(QMainWindow):
         """Automatically detect new devices and update UI when changes occur"""
         try:
             # Only run if no capture is in progress
-            if hasattr(self, 'ocr_worker') and self.ocr_worker and self.ocr_worker.isRunning():
+            if self._ocr_in_flight():
                 return
             
             # Get current device information
@@ -3147,10 +3926,54 @@ class BiosensorApp(QMainWindow):
             # Silently handle errors to avoid disrupting the UI
             print(f"DEBUG: Auto-detect error: {e}")
         
-    def update_status(self, message: str, color: str = "black"):
-        """Update status label with colored message"""
-        self.status_label.setText(message)
-        self.status_label.setStyleSheet(f"color: {color}; font-weight: bold;")
+    def update_status(self, message: str, color: str = "black", force: bool = False):
+        """Update status label with colored message (coalesced unless `force`)"""
+        self._pending_status = (message, color)
+        self._schedule_ui_flush(force)
+    
+    def _schedule_ui_flush(self, force: bool = False):
+        """Apply pending label updates now if forced, else once per UI_UPDATE_MIN_INTERVAL_SECS"""
+        if force:
+            self._flush_ui_updates()
+            return
+        if not self._ui_flush_scheduled:
+            self._ui_flush_scheduled = True
+            wait = UI_UPDATE_MIN_INTERVAL_SECS - (time.monotonic() - self._last_ui_flush)
+            QTimer.singleShot(max(0, int(wait * 1000)), self._flush_ui_updates)
+    
+    def _flush_ui_updates(self):
+        """Paint the most recent pending status and task progress"""
+        self._ui_flush_scheduled = False
+        self._last_ui_flush = time.monotonic()
+        
+        if self._pending_status is not None:
+            message, color = self._pending_status
+            self._pending_status = None
+            self.status_label.setText(message)
+            self.status_label.setStyleSheet(f"color: {color}; font-weight: bold;")
+        
+        if self._pending_progress is not None:
+            progress, message = self._pending_progress
+            self._pending_progress = None
+            self.progress_bar.setValue(progress)
+            
+            if message:
+                self.progress_bar.setFormat(f"{message} ({progress}%)")
+            else:
+                self.progress_bar.setFormat(f"{progress}%")
+            
+            # Update completion indicator
+            if progress < 30:
+                self.completion_label.setText("🔄 Initializing...")
+                self.completion_label.setStyleSheet("color: #FFA726;")
+            elif progress < 70:
+                self.completion_label.setText("⚡ Processing...")
+                self.completion_label.setStyleSheet("color: #2196F3;")
+            elif progress < 100:
+                self.completion_label.setText("🔍 Finalizing...")
+                self.completion_label.setStyleSheet("color: #FF9800;")
+            
+            self.completion_label.setVisible(True)
     
     def pause_all_operations(self):
         """Pause all timers and operations to prevent USB disconnection during capture"""
@@ -3204,14 +4027,105 @@ class BiosensorApp(QMainWindow):
         except Exception as e:
             print(f"DEBUG: Error resuming operations: {e}")
     
+    def _get_sct(self):
+        """Return this thread's MSS instance, opening it on first use"""
+        sct = getattr(self._mss_local, 'sct', None)
+        if sct is None:
+            sct = mss.mss()
+            self._mss_local.sct = sct
+            self._mss_instances.append(sct)
+        return sct
+    
+    def _grab_dxcam_frame(self, left: int, top: int, width: int, height: int):
+        """Grab a screen region with the shared DXcam camera (Windows), returning the frame or None if black/failed/unavailable"""
+        if not DXCAM_AVAILABLE or PLATFORM != 'windows':
+            return None
+        try:
+            if self._dxcam is None:
+                # Grab frames in the channel order _write_png expects (BGR for OpenCV, RGB for PIL)
+                self._dxcam = dxcam.create(output_color="BGR" if CV2_AVAILABLE else "RGB")
+            if not self._dxcam:
+                return None
+            frame = self._dxcam.grab(region=(left, top, left + width, top + height))
+            # Check the raw frame is not just black; it is encoded as-is in the background
+            if frame is not None and frame.size > 0 and not _is_blank(frame):
+                return frame
+        except Exception as e:
+            print(f"DXcam failed: {e}")
+        return None
+    
+    def _grab_mss_frame(self, left: int, top: int, width: int, height: int):
+        """Grab a screen region with this thread's MSS instance, returning a BGRX view or None if black/failed.
+        
+        The view wraps the grab's own raw buffer (MSS hands out a new one per grab),
+        so it stays valid after later grabs; conversion for encoding is left to the
+        encode pool.
+        """
+        try:
+            sct = self._get_sct()
+            monitor = {
+                "top": top,
+                "left": left,
+                "width": width,
+                "height": height
+            }
+            
+            # Grab the screenshot
+            sct_img = sct.grab(monitor)
+            
+            # View the raw BGRA buffer as an array without copying it
+            bgrx = np.frombuffer(sct_img.raw, dtype=np.uint8).reshape(sct_img.height, sct_img.width, 4)
+            
+            # Check if image is not just black
+            if not _is_blank(bgrx):
+                return bgrx
+            print("MSS captured black image, trying fallback...")
+        except Exception as e:
+            print(f"MSS failed: {e}")
+        return None
+    
+    def _probe_scrot_fallback(self) -> bool:
+        """Decide once whether spawning scrot per capture is needed (MSS/Xlib unusable)"""
+        if XLIB_AVAILABLE:
+            return False
+        try:
+            self._get_sct().grab({"top": 0, "left": 0, "width": 1, "height": 1})
+            return False
+        except Exception as e:
+            print(f"MSS unavailable at startup: {e}")
+        return shutil.which("scrot") is not None
+    
+    def _xlib_grab(self, left: int, top: int, width: int, height: int):
+        """Grab a screen region through the shared X11 connection, returning a PIL Image"""
+        if self._xdisplay is None:
+            self._xdisplay = xdisplay.Display()
+        root = self._xdisplay.screen().root
+        raw = root.get_image(left, top, width, height, X.ZPixmap, 0xffffffff)
+        return Image.frombuffer("RGB", (width, height), raw.data, "raw", "BGRX", 0, 1)
+    
+    def _save_image_async(self, img, filepath: str, keep_file: bool = True):
+        """Queue a PNG encode of `img` (PIL image or BGRX view) to `filepath` and its OCR upload on the encoder pool.
+        
+        With `keep_file=False` nothing is written: only the OCR upload is encoded, and
+        the future stays in _pending_saves until process_with_ocr takes it.
+        """
+        ocr_max_dimension = self.ocr_max_dimension if self.ocr_downscale_enabled else None
+        future = self._encode_pool.submit(_encode_capture, img, filepath if keep_file else None,
+                                          ocr_max_dimension)
+        self._pending_saves[filepath] = future
+        if keep_file:
+            future.add_done_callback(lambda _: self._pending_saves.pop(filepath, None))
+        else:
+            self._unsaved_captures.add(filepath)
+        return future
+    
     def take_screenshot_safe(self, window):
         """Take screenshot with minimal file operations to prevent USB disconnection"""
         try:
             self.update_status("📷 Taking screenshot...", "blue")
             
-            # Create unique filename with timestamp
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")[:-3]
-            filename = f"screenshot_{timestamp}.png"
+            # Create unique filename (nanosecond timestamp + capture sequence number)
+            filename = f"screenshot_{time.time_ns()}_{next(self._shot_seq)}.png"
             image_path = os.path.join(self.screenshots_dir, filename)
             
             # Use the most stable screenshot method
@@ -3219,18 +4133,19 @@ class BiosensorApp(QMainWindow):
             
             # Method 1: Try MSS (most stable)
             try:
-                with mss.mss() as sct:
-                    monitor = {
-                        "top": window.top,
-                        "left": window.left,
-                        "width": window.width,
-                        "height": window.height
-                    }
-                    screenshot = sct.grab(monitor)
-                    # Save directly without any additional processing
-                    mss.tools.to_png(screenshot.rgb, screenshot.size, output=image_path)
-                    success = True
-                    print(f"DEBUG: Screenshot saved using MSS: {image_path}")
+                sct = self._get_sct()
+                monitor = {
+                    "top": window.top,
+                    "left": window.left,
+                    "width": window.width,
+                    "height": window.height
+                }
+                screenshot = sct.grab(monitor)
+                # Save straight from the raw BGRA buffer (no .rgb repacking copy)
+                Image.frombuffer("RGB", screenshot.size, screenshot.raw, "raw", "BGRX", 0, 1).save(
+                    image_path, compress_level=1)
+                success = True
+                print(f"DEBUG: Screenshot saved using MSS: {image_path}")
             except Exception as e:
                 print(f"DEBUG: MSS method failed: {e}")
             
@@ -3263,7 +4178,7 @@ class BiosensorApp(QMainWindow):
             
             # Create and start OCR worker thread
             self.ocr_worker = OCRWorker(image_path, self.azure_api_key, self.azure_endpoint)
-            self.ocr_worker.finished.connect(lambda result: self.on_ocr_finished_safe(result, task_name))
+            self.ocr_worker.finished.connect(lambda result, _scale: self.on_ocr_finished_safe(result, task_name))
             self.ocr_worker.error.connect(lambda error: self.on_ocr_error_safe(error, task_name))
             self.ocr_worker.start()
             
@@ -3335,28 +4250,10 @@ class BiosensorApp(QMainWindow):
             if raw_text.strip():
                 preview_text = raw_text[:100] + "..." if len(raw_text) > 100 else raw_text
                 self.ocr_status_label.setText(f"✅ OCR Complete! Preview: {preview_text}")
-                self.ocr_status_label.setStyleSheet("""
-                    QLabel {
-                        color: #4CAF50;
-                        padding: 15px;
-                        background: rgba(76, 175, 80, 0.1);
-                        border: 2px solid #4CAF50;
-                        border-radius: 8px;
-                        margin: 10px;
-                    }
-                """)
+                self._set_label_state(self.ocr_status_label, "ok")
             else:
                 self.ocr_status_label.setText("⚠️ OCR Complete but no text detected")
-                self.ocr_status_label.setStyleSheet("""
-                    QLabel {
-                        color: #FF9800;
-                        padding: 15px;
-                        background: rgba(255, 152, 0, 0.1);
-                        border: 2px solid #FF9800;
-                        border-radius: 8px;
-                        margin: 10px;
-                    }
-                """)
+                self._set_label_state(self.ocr_status_label, "no_text")
             
             # Update quick stats
             char_count = len(raw_text)
@@ -3397,28 +4294,11 @@ class BiosensorApp(QMainWindow):
         self.show_progress_bar(task_name)
         print(f"DEBUG: Task started: {task_name}")
     
-    def update_task_progress(self, progress, message=None):
-        """Update the progress of the current task"""
+    def update_task_progress(self, progress, message=None, force: bool = False):
+        """Update the progress of the current task (painted coalesced, see _flush_ui_updates)"""
         self.task_progress = progress
-        self.progress_bar.setValue(progress)
-        
-        if message:
-            self.progress_bar.setFormat(f"{message} ({progress}%)")
-        else:
-            self.progress_bar.setFormat(f"{progress}%")
-        
-        # Update completion indicator
-        if progress < 30:
-            self.completion_label.setText("🔄 Initializing...")
-            self.completion_label.setStyleSheet("color: #FFA726;")
-        elif progress < 70:
-            self.completion_label.setText("⚡ Processing...")
-            self.completion_label.setStyleSheet("color: #2196F3;")
-        elif progress < 100:
-            self.completion_label.setText("🔍 Finalizing...")
-            self.completion_label.setStyleSheet("color: #FF9800;")
-        
-        self.completion_label.setVisible(True)
+        self._pending_progress = (progress, message)
+        self._schedule_ui_flush(force)
     
     def complete_task(self, task_name, success=True):
         """Complete a task and update the navigation system"""
@@ -3432,6 +4312,10 @@ class BiosensorApp(QMainWindow):
         self.current_task = None
         self.task_progress = 100 if success else 0
         
+        # Task boundary: drop stale intermediate progress and paint the latest status now
+        self._pending_progress = None
+        self._flush_ui_updates()
+        
         # Show completion status
         if success:
             self.completion_label.setText("✅ Task Completed Successfully!")
@@ -3482,6 +4366,7 @@ class BiosensorApp(QMainWindow):
     
     def show_progress_bar(self, task_name):
         """Show the gradient progress bar for a task"""
+        self._pending_progress = None  # Don't let the previous task's progress overwrite this
         self.progress_bar.setVisible(True)
         self.progress_bar.setValue(0)
         self.progress_bar.setFormat(f"Starting: {task_name}")
@@ -3561,6 +4446,13 @@ class BiosensorApp(QMainWindow):
                 return device_info
             
             all_windows = gw.getAllWindows()
+            
+            # Skip re-categorization when the set of window titles is unchanged
+            titles = tuple(w.title for w in all_windows if w.title)
+            titles_hash = hash(titles)
+            if titles_hash == self._last_devices_hash and self._last_devices_result is not None:
+                return self._last_devices_result
+            
             device_keywords = self.get_newer_device_keywords()
             
             for window in all_windows:
@@ -3575,17 +4467,13 @@ class BiosensorApp(QMainWindow):
                 if matched_keywords:
                     # Cross-platform attribute handling
                     try:
-                        width = getattr(window, 'width', getattr(window, 'size', [0, 0])[0] if hasattr(window, 'size') else 0)
-                        height = getattr(window, 'height', getattr(window, 'size', [0, 0])[1] if hasattr(window, 'size') else 0)
-                        left = getattr(window, 'left', getattr(window, 'topleft', [0, 0])[0] if hasattr(window, 'topleft') else 0)
-                        top = getattr(window, 'top', getattr(window, 'topleft', [0, 0])[1] if hasattr(window, 'topleft') else 0)
-                        visible = getattr(window, 'visible', getattr(window, 'isVisible', True))
+                        view = _window_view(window)
                         
                         device_entry = {
-                            'title': window.title,
-                            'size': f"{width}x{height}",
-                            'position': f"({left}, {top})",
-                            'visible': visible,
+                            'title': view.title,
+                            'size': f"{view.width}x{view.height}",
+                            'position': f"({view.left}, {view.top})",
+                            'visible': view.visible,
                             'matched_keywords': matched_keywords
                         }
                     except Exception as attr_error:
@@ -3599,18 +4487,9 @@ class BiosensorApp(QMainWindow):
                         }
                     
                     # Categorize device
-                    if any(kw in title_lower for kw in ['phone', 'sm-', 'iphone', 'pixel', 'oneplus', 'xiaomi', 'huawei', 'oppo', 'vivo']):
-                        device_info['mobile_phones'].append(device_entry)
-                    elif any(kw in title_lower for kw in ['tablet', 'ipad', 'tab', 'surface']):
-                        device_info['tablets'].append(device_entry)
-                    elif any(kw in title_lower for kw in ['watch', 'band', 'fitbit', 'garmin', 'amazfit']):
-                        device_info['wearables'].append(device_entry)
-                    elif any(kw in title_lower for kw in ['emulator', 'bluestacks', 'nox', 'memu', 'ldplayer']):
-                        device_info['emulators'].append(device_entry)
-                    elif any(kw in title_lower for kw in ['scrcpy', 'adb', 'vysor', 'android studio']):
-                        device_info['dev_tools'].append(device_entry)
-                    else:
-                        device_info['unknown_devices'].append(device_entry)
+                    device_info[_categorize_device_title(title_lower)].append(device_entry)
+            
+            self._last_devices_hash, self._last_devices_result = titles_hash, device_info
                         
         except Exception as e:
             print(f"DEBUG: Error in device discovery: {e} (Platform: {PLATFORM})")
@@ -3662,49 +4541,58 @@ class BiosensorApp(QMainWindow):
                 self.update_status("❌ Window manager not available. Install PyWinCtl: pip install PyWinCtl", "red")
                 return []
             
-            all_windows = gw.getAllWindows()
-            visible_windows = []
-            
+            all_windows = None
+            if PLATFORM == 'windows':
+                # Read title + geometry in one EnumWindows pass instead of per-property PyWinCtl calls
+                try:
+                    all_windows = _enum_win32_windows()
+                except ImportError:
+                    pass
+            if all_windows is None:
+                all_windows = gw.getAllWindows()
             print(f"DEBUG: Processing {len(all_windows)} total windows on {PLATFORM}...")
             
             # Platform-specific system window exclusions
-            excluded_titles = ['Program Manager', 'Desktop Window Manager']  # Windows
+            excluded_titles = {'Program Manager', 'Desktop Window Manager'}  # Windows
             if PLATFORM == 'linux':
-                excluded_titles.extend(['Desktop', 'Panel', 'Taskbar', 'Unity Panel', 'gnome-panel', 
-                                      'Plasma', 'plasmashell', 'kwin', 'compiz'])
+                excluded_titles.update(['Desktop', 'Panel', 'Taskbar', 'Unity Panel', 'gnome-panel', 
+                                        'Plasma', 'plasmashell', 'kwin', 'compiz'])
             elif PLATFORM == 'darwin':  # macOS
-                excluded_titles.extend(['Dock', 'Menu Bar', 'Spotlight', 'SystemUIServer'])
+                excluded_titles.update(['Dock', 'Menu Bar', 'Spotlight', 'SystemUIServer'])
             
-            for window in all_windows:
-                try:
-                    # Only skip completely empty titles
-                    if not window.title or not window.title.strip():
-                        continue
-                    
-                    # Skip platform-specific system windows
-                    if window.title in excluded_titles:
-                        continue
-                    
-                    # Cross-platform dimension checking
+            def sort_keyed(windows):
+                """Filter windows in one pass, yielding (sort key, window) with the title read once"""
+                for window in windows:
                     try:
-                        width = getattr(window, 'width', getattr(window, 'size', [0, 0])[0] if hasattr(window, 'size') else 0)
-                        height = getattr(window, 'height', getattr(window, 'size', [0, 0])[1] if hasattr(window, 'size') else 0)
+                        title = window.title
                         
-                        # Add windows with reasonable dimensions
-                        if width > 0 and height > 0:
-                            visible_windows.append(window)
-                            print(f"DEBUG: Added window: {window.title} ({width}x{height})")
-                    except:
-                        # If we can't get dimensions, include it anyway
-                        visible_windows.append(window)
-                        print(f"DEBUG: Added window (no dims): {window.title}")
+                        # Only skip completely empty titles
+                        if not title or not title.strip():
+                            continue
+                        
+                        # Skip platform-specific system windows
+                        if title in excluded_titles:
+                            continue
+                        
+                        # Cross-platform dimension checking
+                        try:
+                            width, height, _, _ = _window_geom(window)
                             
-                except Exception as window_error:
-                    print(f"DEBUG: Error processing window: {window_error}")
-                    continue
+                            # Add windows with reasonable dimensions
+                            if width > 0 and height > 0:
+                                print(f"DEBUG: Added window: {title} ({width}x{height})")
+                                yield title.casefold(), window
+                        except:
+                            # If we can't get dimensions, include it anyway
+                            print(f"DEBUG: Added window (no dims): {title}")
+                            yield title.casefold(), window
+                                
+                    except Exception as window_error:
+                        print(f"DEBUG: Error processing window: {window_error}")
+                        continue
             
-            # Sort windows by title
-            visible_windows.sort(key=lambda w: w.title.lower())
+            # Sort windows by title (case-insensitive, Unicode-aware) straight off the filter
+            visible_windows = [window for _, window in sorted(sort_keyed(all_windows), key=itemgetter(0))]
             print(f"DEBUG: Total windows found: {len(visible_windows)} on {PLATFORM}")
             return visible_windows
             
@@ -3712,8 +4600,37 @@ class BiosensorApp(QMainWindow):
             self.update_status(f"❌ Error getting windows: {str(e)} (Platform: {PLATFORM})", "red")
             return []
     
+    def _get_windows_cached(self, ttl: float = 0.5) -> list:
+        """Return the OS window list, reusing a snapshot taken within the last `ttl` seconds"""
+        timestamp, windows, _ = self._window_cache
+        now = time.monotonic()
+        if windows is None or now - timestamp >= ttl:
+            windows = gw.getAllWindows()
+            window_map = {}
+            for w in windows:
+                title = getattr(w, 'title', None)
+                if title:
+                    window_map.setdefault(title, w)  # First match wins, like the old linear scan
+            self._window_cache = (now, windows, window_map)
+        return windows
+    
+    def _find_window_by_title(self, title):
+        """Look up a window in the cached window list by its exact title"""
+        self._get_windows_cached()
+        return self._window_cache[2].get(title)
+    
+    def _invalidate_window_cache(self):
+        """Drop the cached window list so the next lookup enumerates windows again"""
+        self._window_cache = (0.0, None, {})
+        self._selected_window_cache = None
+    
+    def _invalidate_selected_window(self, *_):
+        """Forget the cached selected window (combo selection changed or windows refreshed)"""
+        self._selected_window_cache = None
+    
     def refresh_windows(self):
         """Simple refresh - show ALL windows instantly"""
+        self._invalidate_window_cache()
         try:
             current_selection = None
             if self.window_combo.currentIndex() >= 0:
@@ -3734,11 +4651,11 @@ class BiosensorApp(QMainWindow):
             self.window_combo.addItem("🔍 Select a window to capture...", None)
             
             # Add ALL windows in simple list - no categories!
+            items = []
             for window in windows:
                 # Use cross-platform attribute checking for window dimensions
                 try:
-                    width = getattr(window, 'width', getattr(window, 'size', [0, 0])[0] if hasattr(window, 'size') else 0)
-                    height = getattr(window, 'height', getattr(window, 'size', [0, 0])[1] if hasattr(window, 'size') else 0)
+                    width, height, _, _ = _window_geom(window)
                     display_text = f"{window.title} ({width}x{height})"
                 except Exception as e:
                     # Fallback if we can't get dimensions
@@ -3747,14 +4664,22 @@ class BiosensorApp(QMainWindow):
                 
                 if len(display_text) > 80:
                     display_text = display_text[:77] + "..."
-                self.window_combo.addItem(display_text, window)
+                item = QStandardItem(display_text)
+                item.setData(window, Qt.UserRole)
+                items.append(item)
+            
+            # Insert all rows into the combo model in one batch, without per-item signals
+            self.window_combo.blockSignals(True)
+            try:
+                self.window_combo.model().invisibleRootItem().appendRows(items)
+            finally:
+                self.window_combo.blockSignals(False)
             
             # Try to restore previous selection
             if current_selection:
-                for i in range(self.window_combo.count()):
-                    if current_selection in self.window_combo.itemText(i):
-                        self.window_combo.setCurrentIndex(i)
-                        break
+                index = self.window_combo.findText(current_selection, Qt.MatchContains | Qt.MatchCaseSensitive)
+                if index >= 0:
+                    self.window_combo.setCurrentIndex(index)
             
             self.update_status(f"✅ Found {len(windows)} windows - ALL devices shown!", "green")
             
@@ -3762,13 +4687,16 @@ class BiosensorApp(QMainWindow):
             self.update_status(f"❌ Error refreshing windows: {str(e)}", "red")
     
     def get_selected_window(self):
-        """Get the currently selected window from combo box"""
+        """Get the currently selected window from combo box (cached until the selection changes)"""
+        if self._selected_window_cache is not None:
+            return self._selected_window_cache
         try:
             current_index = self.window_combo.currentIndex()
             if current_index >= 0:
                 window = self.window_combo.itemData(current_index)
                 # Check if it's a valid window object (not None or separator)
                 if window and hasattr(window, 'title') and hasattr(window, 'left'):
+                    self._selected_window_cache = window
                     return window
             return None
         except Exception as e:
@@ -3789,21 +4717,18 @@ class BiosensorApp(QMainWindow):
                     
                     # Check if window is minimized
                     if win32gui.IsIconic(hwnd):
-                        # Restore the window
+                        # Restore the window (wait only as long as the restore actually takes)
                         win32gui.ShowWindow(hwnd, win32con.SW_RESTORE)
-                        time.sleep(0.2)  # Give time for window to restore
+                        _wait_restored(hwnd, 0.2)
                     
                     # Bring window to foreground
                     win32gui.SetForegroundWindow(hwnd)
-                    time.sleep(0.3)  # Give time for window to come to front
                     
                     # Ensure window is visible
                     win32gui.ShowWindow(hwnd, win32con.SW_SHOW)
-                    time.sleep(0.2)
                     
-                    # Verify window is now in foreground
-                    foreground_hwnd = win32gui.GetForegroundWindow()
-                    if foreground_hwnd == hwnd:
+                    # Verify window is now in foreground (returns as soon as it comes to front)
+                    if _wait_foreground(hwnd, 0.5):
                         self.update_status(f"✅ Window activated: {window.title}", "green")
                         return True
                     else:
@@ -3817,6 +4742,16 @@ class BiosensorApp(QMainWindow):
             elif PLATFORM == 'linux':
                 # Linux-specific activation using xdotool/wmctrl
                 try:
+                    if XDO_AVAILABLE:
+                        # In-process libxdo calls - no xdotool fork/exec
+                        if self._xdo is None:
+                            self._xdo = Xdo()
+                        window_ids = self._xdo.search_windows(winname=window.title.encode('utf-8'))
+                        if window_ids:
+                            self._xdo.activate_window(window_ids[0])
+                            time.sleep(0.3)
+                            self.update_status(f"✅ Window activated (Linux): {window.title}", "green")
+                            return True
                     if LINUX_TOOLS_AVAILABLE:
                         # Try to activate using xdotool
                         result = subprocess.run(['xdotool', 'search', '--name', window.title], 
@@ -3869,34 +4804,26 @@ class BiosensorApp(QMainWindow):
     def take_screenshot_background(self, window) -> Optional[str]:
         """Take screenshot without activating window (background capture)"""
         try:
-            # Generate unique filename with appropriate directory
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            random_num = random.randint(1000, 9999)
-            
+            # Generate unique filename (nanosecond timestamp + sequence) in the pre-created directory
             # Determine if this is auto-capture or manual capture
             if hasattr(self, 'auto_checkbox') and self.auto_checkbox.isChecked():
                 # Auto-capture - save to auto directory
-                auto_images_dir = os.path.join(self.screenshots_dir, "auto_captures")
-                os.makedirs(auto_images_dir, exist_ok=True)
-                filename = f"auto_background_{timestamp}_{random_num}.png"
-                filepath = os.path.join(auto_images_dir, filename)
+                filename = f"auto_background_{time.time_ns()}_{next(self._shot_seq)}.png"
+                filepath = os.path.join(self.auto_images_dir, filename)
+                # Screenshots that would be auto-deleted right after OCR are never written
+                # (batch OCR stacks frames from the saved files, so it keeps them)
+                keep_file = not self.enable_auto_delete_screenshots or self.ocr_batch_size > 1
             else:
                 # Manual capture - save to manual directory
-                manual_images_dir = os.path.join(self.screenshots_dir, "manual_captures")
-                os.makedirs(manual_images_dir, exist_ok=True)
-                filename = f"manual_background_{timestamp}_{random_num}.png"
-                filepath = os.path.join(manual_images_dir, filename)
+                filename = f"manual_background_{time.time_ns()}_{next(self._shot_seq)}.png"
+                filepath = os.path.join(self.manual_images_dir, filename)
+                keep_file = True
+            capture_outcome = "saved" if keep_file else "captured in memory (not written)"
             
             # Refresh window information to get current position
             try:
-                # Get fresh window list and find our target window
-                all_windows = pywinctl.getAllWindows() if WINDOW_MANAGER_AVAILABLE else gw.getAllWindows()
-                target_window = None
-                
-                for w in all_windows:
-                    if hasattr(w, 'title') and hasattr(window, 'title') and w.title == window.title:
-                        target_window = w
-                        break
+                # Look up our target window in the (recently cached) window list
+                target_window = self._find_window_by_title(getattr(window, 'title', None))
                 
                 if target_window:
                     window = target_window  # Use refreshed window object
@@ -3908,10 +4835,7 @@ class BiosensorApp(QMainWindow):
             
             # Get cross-platform window dimensions and position
             try:
-                width = getattr(window, 'width', getattr(window, 'size', [0, 0])[0] if hasattr(window, 'size') else 0)
-                height = getattr(window, 'height', getattr(window, 'size', [0, 0])[1] if hasattr(window, 'size') else 0)
-                left = getattr(window, 'left', getattr(window, 'topleft', [0, 0])[0] if hasattr(window, 'topleft') else 0)
-                top = getattr(window, 'top', getattr(window, 'topleft', [0, 0])[1] if hasattr(window, 'topleft') else 0)
+                width, height, left, top = _window_geom(window)
                 
                 print(f"DEBUG: Window dimensions - Width: {width}, Height: {height}, Left: {left}, Top: {top}")
                 self.update_status(f"📸 Background capturing: {window.title} ({width}x{height}) at ({left},{top})", "blue")
@@ -3931,8 +4855,16 @@ class BiosensorApp(QMainWindow):
                 self.update_status(f"⚠️ Small window detected: {width}x{height} - capturing anyway", "orange")
                 print(f"DEBUG: Small window dimensions: {width}x{height} - proceeding with capture")
             
-            # Method 1: Windows - Use PrintWindow API for true background capture
+            # Method 1: Windows - Use PrintWindow API for true background capture.
+            # PrintWindow often comes back blank for GPU-rendered windows, so start the MSS
+            # grab alongside it (unless the previous one is still running). It is cancelled,
+            # or its frame dropped, when PrintWindow produces a usable image. With DXcam
+            # installed the fallback is the much faster DXcam grab, so nothing is speculated.
+            mss_future = None
             if PLATFORM == 'windows':
+                if not DXCAM_AVAILABLE and (self._mss_speculation is None or self._mss_speculation.done()):
+                    mss_future = self._capture_pool.submit(self._grab_mss_frame, left, top, width, height)
+                    self._mss_speculation = mss_future
                 try:
                     import win32gui
                     import win32ui
@@ -3965,94 +4897,41 @@ class BiosensorApp(QMainWindow):
                         height = bottom - top
                         
                         if width > 0 and height > 0:
-                            # Create device contexts
+                            # Create device contexts and bitmap once, reused for every PrintWindow attempt
                             hwndDC = win32gui.GetWindowDC(hwnd)
                             mfcDC = win32ui.CreateDCFromHandle(hwndDC)
                             saveDC = mfcDC.CreateCompatibleDC()
-                            
-                            # Create bitmap
                             saveBitMap = win32ui.CreateBitmap()
-                            saveBitMap.CreateCompatibleBitmap(mfcDC, width, height)
-                            saveDC.SelectObject(saveBitMap)
-                            
-                            # Use PrintWindow with PW_RENDERFULLCONTENT flag for background capture
-                            PW_RENDERFULLCONTENT = 0x00000002
-                            result = windll.user32.PrintWindow(hwnd, saveDC.GetSafeHdc(), PW_RENDERFULLCONTENT)
-                            
-                            if result:
-                                # Convert to PIL Image
-                                bmpinfo = saveBitMap.GetInfo()
-                                bmpstr = saveBitMap.GetBitmapBits(True)
-                                
-                                img = Image.frombuffer(
-                                    'RGB',
-                                    (bmpinfo['bmWidth'], bmpinfo['bmHeight']),
-                                    bmpstr, 'raw', 'BGRX', 0, 1
-                                )
-                                
-                                # Check if image is not blank
-                                extrema = img.getextrema()
-                                is_blank = all(channel == (0, 0) for channel in extrema)
-                                
-                                if not is_blank:
-                                    img.save(filepath)
-                                    
-                                    # Cleanup
-                                    win32gui.DeleteObject(saveBitMap.GetHandle())
-                                    saveDC.DeleteDC()
-                                    mfcDC.DeleteDC()
-                                    win32gui.ReleaseDC(hwnd, hwndDC)
-                                    
-                                    self.update_status(f"✅ Background screenshot saved: {filename}", "green")
-                                    return filepath
-                                else:
-                                    print("PrintWindow returned blank image, trying fallback...")
-                            
-                            # Cleanup on failure
-                            win32gui.DeleteObject(saveBitMap.GetHandle())
-                            saveDC.DeleteDC()
-                            mfcDC.DeleteDC()
-                            win32gui.ReleaseDC(hwnd, hwndDC)
                             
-                            # Try alternative PrintWindow flags
-                            if not result:
-                                # Recreate contexts for second attempt
-                                hwndDC = win32gui.GetWindowDC(hwnd)
-                                mfcDC = win32ui.CreateDCFromHandle(hwndDC)
-                                saveDC = mfcDC.CreateCompatibleDC()
-                                saveBitMap = win32ui.CreateBitmap()
+                            try:
                                 saveBitMap.CreateCompatibleBitmap(mfcDC, width, height)
                                 saveDC.SelectObject(saveBitMap)
                                 
-                                # Try with flag 0 (standard rendering)
-                                result = windll.user32.PrintWindow(hwnd, saveDC.GetSafeHdc(), 0)
-                                
-                                if result:
+                                # PW_RENDERFULLCONTENT first for background capture, then standard rendering (flag 0)
+                                PW_RENDERFULLCONTENT = 0x00000002
+                                for flag in (PW_RENDERFULLCONTENT, 0):
+                                    result = windll.user32.PrintWindow(hwnd, saveDC.GetSafeHdc(), flag)
+                                    if not result:
+                                        continue
+                                    
+                                    # View the BGRX bitmap bits as an array (converted in the encode pool)
                                     bmpinfo = saveBitMap.GetInfo()
                                     bmpstr = saveBitMap.GetBitmapBits(True)
-                                    
-                                    img = Image.frombuffer(
-                                        'RGB',
-                                        (bmpinfo['bmWidth'], bmpinfo['bmHeight']),
-                                        bmpstr, 'raw', 'BGRX', 0, 1
+                                    bgrx = np.frombuffer(bmpstr, dtype=np.uint8).reshape(
+                                        bmpinfo['bmHeight'], bmpinfo['bmWidth'], 4
                                     )
                                     
-                                    extrema = img.getextrema()
-                                    is_blank = all(channel == (0, 0) for channel in extrema)
-                                    
-                                    if not is_blank:
-                                        img.save(filepath)
-                                        
-                                        # Cleanup
-                                        win32gui.DeleteObject(saveBitMap.GetHandle())
-                                        saveDC.DeleteDC()
-                                        mfcDC.DeleteDC()
-                                        win32gui.ReleaseDC(hwnd, hwndDC)
-                                        
-                                        self.update_status(f"✅ Background screenshot saved: {filename}", "green")
+                                    # Check if image is not blank
+                                    if not _is_blank(bgrx):
+                                        if mss_future is not None:
+                                            mss_future.cancel()
+                                        self._save_image_async(bgrx, filepath, keep_file)
+                                        self.update_status(f"✅ Background screenshot {capture_outcome}: {filename}", "green")
                                         return filepath
-                                
-                                # Final cleanup
+                                    
+                                    print(f"PrintWindow (flag {flag}) returned blank image, trying fallback...")
+                            finally:
+                                # Cleanup exactly once, whichever attempt succeeded
                                 win32gui.DeleteObject(saveBitMap.GetHandle())
                                 saveDC.DeleteDC()
                                 mfcDC.DeleteDC()
@@ -4060,36 +4939,35 @@ class BiosensorApp(QMainWindow):
                             
                 except Exception as e:
                     print(f"Windows PrintWindow failed: {e}")
+                
+                # Method 1b: DXcam (Desktop Duplication) for windows PrintWindow can't render
+                frame = self._grab_dxcam_frame(left, top, width, height)
+                if frame is not None:
+                    self._save_image_async(frame, filepath, keep_file)
+                    self.update_status(f"✅ Background screenshot {capture_outcome} (DXcam): {filename}", "green")
+                    return filepath
             
-            # Method 2: Cross-platform MSS with window coordinates
-            try:
-                with mss.mss() as sct:
-                    monitor = {
-                        "top": top,
-                        "left": left,
-                        "width": width,
-                        "height": height
-                    }
-                    
-                    # Grab the screenshot
-                    sct_img = sct.grab(monitor)
-                    
-                    # Convert to PIL Image
-                    img = Image.frombytes("RGB", sct_img.size, sct_img.bgra, "raw", "BGRX")
-                    
-                    # Check if image is not just black
-                    if img.getextrema() != ((0, 0), (0, 0), (0, 0)):
-                        img.save(filepath)
-                        self.update_status(f"✅ Background screenshot saved (MSS): {filename}", "green")
-                        return filepath
-                    else:
-                        print("MSS captured black image, trying fallback...")
-                    
-            except Exception as e:
-                print(f"MSS failed: {e}")
+            # Method 2: Cross-platform MSS with window coordinates (the speculative grab, if one was started)
+            if mss_future is not None:
+                frame = mss_future.result()
+            else:
+                frame = self._grab_mss_frame(left, top, width, height)
+            if frame is not None:
+                self._save_image_async(frame, filepath, keep_file)
+                self.update_status(f"✅ Background screenshot {capture_outcome} (MSS): {filename}", "green")
+                return filepath
             
             # Method 3: Linux-specific screenshot methods
-            if PLATFORM == 'linux':
+            if PLATFORM == 'linux' and XLIB_AVAILABLE:
+                try:
+                    img = self._xlib_grab(left, top, width, height)
+                    self._save_image_async(img, filepath, keep_file)
+                    self.update_status(f"✅ Background screenshot {capture_outcome} (Xlib): {filename}", "green")
+                    return filepath
+                except Exception as e:
+                    print(f"Xlib capture failed: {e}")
+            
+            if self._scrot_fallback:
                 try:
                     import subprocess
                     scrot_cmd = [
@@ -4097,7 +4975,7 @@ class BiosensorApp(QMainWindow):
                         "-a", f"{left},{top},{width},{height}",
                         filepath
                     ]
-                    result = subprocess.run(scrot_cmd, capture_output=True, text=True)
+                    result = subprocess.run(scrot_cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
                     if result.returncode == 0 and os.path.exists(filepath):
                         self.update_status(f"✅ Background screenshot saved (scrot): {filename}", "green")
                         return filepath
@@ -4108,17 +4986,13 @@ class BiosensorApp(QMainWindow):
             try:
                 screenshot = pyautogui.screenshot(region=(left, top, width, height))
                 
-                # Check if screenshot is not just black
-                extrema = screenshot.getextrema()
-                if extrema != ((0, 0), (0, 0), (0, 0)):
-                    screenshot.save(filepath)
-                    self.update_status(f"✅ Background screenshot saved (PyAutoGUI): {filename}", "green")
-                    return filepath
+                # Save even a black capture for debugging, but flag it
+                self._save_image_async(screenshot, filepath, keep_file)
+                if not _is_blank(screenshot):
+                    self.update_status(f"✅ Background screenshot {capture_outcome} (PyAutoGUI): {filename}", "green")
                 else:
                     self.update_status("⚠️ Captured image appears to be black/empty", "orange")
-                    # Save anyway for debugging
-                    screenshot.save(filepath)
-                    return filepath
+                return filepath
                     
             except Exception as e:
                 print(f"PyAutoGUI failed: {e}")
@@ -4141,17 +5015,13 @@ class BiosensorApp(QMainWindow):
             if WINDOW_MANAGER_AVAILABLE:
                 try:
                     # Use PyWinCtl for cross-platform window refresh
-                    all_windows = pywinctl.getAllWindows()
-                    for w in all_windows:
-                        if hasattr(w, 'title') and w.title == window.title:
-                            # Check if window has valid dimensions
-                            width = getattr(w, 'width', getattr(w, 'size', [0, 0])[0] if hasattr(w, 'size') else 0)
-                            height = getattr(w, 'height', getattr(w, 'size', [0, 0])[1] if hasattr(w, 'size') else 0)
-                            visible = getattr(w, 'visible', getattr(w, 'isVisible', True))
-                            
-                            if visible and width > 0 and height > 0:
-                                window = w  # Use updated window object
-                                break
+                    w = self._find_window_by_title(window.title)
+                    if w is not None:
+                        # Check if window has valid dimensions
+                        view = _window_view(w)
+                        
+                        if view.visible and view.width > 0 and view.height > 0:
+                            window = w  # Use updated window object
                 except Exception as e:
                     print(f"Window refresh failed: {e}")
                     pass  # Use original window if refresh fails
@@ -4169,8 +5039,7 @@ class BiosensorApp(QMainWindow):
             
             # Step 3: Validate window region - Cross-platform attribute handling
             try:
-                width = getattr(window, 'width', getattr(window, 'size', [0, 0])[0] if hasattr(window, 'size') else 0)
-                height = getattr(window, 'height', getattr(window, 'size', [0, 0])[1] if hasattr(window, 'size') else 0)
+                width, height, _, _ = _window_geom(window)
                 
                 if width <= 0 or height <= 0:
                     self.update_status("❌ Invalid window dimensions", "red")
@@ -4179,30 +5048,20 @@ class BiosensorApp(QMainWindow):
                 self.update_status(f"❌ Could not get window dimensions: {str(e)}", "red")
                 return None
             
-            # Generate unique filename with appropriate directory
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            random_num = random.randint(1000, 9999)
-            
+            # Generate unique filename (nanosecond timestamp + sequence) in the pre-created directory
             # Determine if this is auto-capture or manual capture
             if hasattr(self, 'auto_checkbox') and self.auto_checkbox.isChecked():
                 # Auto-capture - save to auto directory
-                auto_images_dir = os.path.join(self.screenshots_dir, "auto_captures")
-                os.makedirs(auto_images_dir, exist_ok=True)
-                filename = f"auto_screenshot_{timestamp}_{random_num}.png"
-                filepath = os.path.join(auto_images_dir, filename)
+                filename = f"auto_screenshot_{time.time_ns()}_{next(self._shot_seq)}.png"
+                filepath = os.path.join(self.auto_images_dir, filename)
             else:
                 # Manual capture - save to manual directory
-                manual_images_dir = os.path.join(self.screenshots_dir, "manual_captures")
-                os.makedirs(manual_images_dir, exist_ok=True)
-                filename = f"manual_screenshot_{timestamp}_{random_num}.png"
-                filepath = os.path.join(manual_images_dir, filename)
+                filename = f"manual_screenshot_{time.time_ns()}_{next(self._shot_seq)}.png"
+                filepath = os.path.join(self.manual_images_dir, filename)
             
             # Get cross-platform window dimensions and position
             try:
-                width = getattr(window, 'width', getattr(window, 'size', [0, 0])[0] if hasattr(window, 'size') else 0)
-                height = getattr(window, 'height', getattr(window, 'size', [0, 0])[1] if hasattr(window, 'size') else 0)
-                left = getattr(window, 'left', getattr(window, 'topleft', [0, 0])[0] if hasattr(window, 'topleft') else 0)
-                top = getattr(window, 'top', getattr(window, 'topleft', [0, 0])[1] if hasattr(window, 'topleft') else 0)
+                width, height, left, top = _window_geom(window)
                 
                 self.update_status(f"📸 Capturing window: {window.title} ({width}x{height})", "blue")
             except Exception as e:
@@ -4210,62 +5069,39 @@ class BiosensorApp(QMainWindow):
                 return None
             
             # Method 1: Try DXcam (fastest, Windows Desktop Duplication API) - Windows only
-            if DXCAM_AVAILABLE and PLATFORM == "Windows":
-                try:
-                    camera = dxcam.create()
-                    if camera:
-                        region = (left, top, left + width, top + height)
-                        frame = camera.grab(region=region)
-                        if frame is not None and frame.size > 0:
-                            img = Image.fromarray(frame)
-                            # Check if image is not just black
-                            if img.getextrema() != ((0, 0), (0, 0), (0, 0)):
-                                img.save(filepath)
-                                camera.release()
-                                self.update_status(f"✅ Screenshot saved (DXcam): {filename}", "green")
-                                return filepath
-                        camera.release()
-                except Exception as e:
-                    print(f"DXcam failed: {e}")
+            frame = self._grab_dxcam_frame(left, top, width, height)
+            if frame is not None:
+                self._save_image_async(frame, filepath)
+                self.update_status(f"✅ Screenshot saved (DXcam): {filename}", "green")
+                return filepath
             
             # Method 2: MSS (ultra-fast cross-platform)
-            try:
-                with mss.mss() as sct:
-                    monitor = {
-                        "top": top,
-                        "left": left,
-                        "width": width,
-                        "height": height
-                    }
-                    
-                    # Grab the screenshot
-                    sct_img = sct.grab(monitor)
-                    
-                    # Convert to PIL Image
-                    img = Image.frombytes("RGB", sct_img.size, sct_img.bgra, "raw", "BGRX")
-                    
-                    # Check if image is not just black
-                    if img.getextrema() != ((0, 0), (0, 0), (0, 0)):
-                        img.save(filepath)
-                        self.update_status(f"✅ Screenshot saved (MSS): {filename}", "green")
-                        return filepath
-                    else:
-                        print("MSS captured black image, trying fallback...")
-                    
-            except Exception as e:
-                print(f"MSS failed: {e}")
+            frame = self._grab_mss_frame(left, top, width, height)
+            if frame is not None:
+                _write_png(_bgrx_to_frame(frame), filepath)
+                self.update_status(f"✅ Screenshot saved (MSS): {filename}", "green")
+                return filepath
             
             # Method 3: Linux-specific screenshot methods
-            if PLATFORM == "Linux":
+            if PLATFORM == 'linux' and XLIB_AVAILABLE:
+                try:
+                    img = self._xlib_grab(left, top, width, height)
+                    img.save(filepath)
+                    self.update_status(f"✅ Screenshot saved (Xlib): {filename}", "green")
+                    return filepath
+                except Exception as e:
+                    print(f"Xlib capture failed: {e}")
+            
+            if self._scrot_fallback:
                 try:
-                    # Try using scrot for Linux
+                    # Fall back to scrot
                     import subprocess
                     scrot_cmd = [
                         "scrot", 
                         "-a", f"{left},{top},{width},{height}",
                         filepath
                     ]
-                    result = subprocess.run(scrot_cmd, capture_output=True, text=True)
+                    result = subprocess.run(scrot_cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
                     if result.returncode == 0 and os.path.exists(filepath):
                         self.update_status(f"✅ Screenshot saved (scrot): {filename}", "green")
                         return filepath
@@ -4274,22 +5110,15 @@ class BiosensorApp(QMainWindow):
             
             # Method 4: Fallback to pyautogui with window activation (cross-platform)
             try:
-                # Additional wait to ensure window is ready
-                time.sleep(0.5)
-                
                 screenshot = pyautogui.screenshot(region=(left, top, width, height))
                 
-                # Check if screenshot is not just black
-                extrema = screenshot.getextrema()
-                if extrema != ((0, 0), (0, 0), (0, 0)):
-                    screenshot.save(filepath)
+                # Save even a black capture for debugging, but flag it
+                screenshot.save(filepath)
+                if not _is_blank(screenshot):
                     self.update_status(f"✅ Screenshot saved (PyAutoGUI): {filename}", "green")
-                    return filepath
                 else:
                     self.update_status("⚠️ Captured image appears to be black/empty", "orange")
-                    # Save anyway for debugging
-                    screenshot.save(filepath)
-                    return filepath
+                return filepath
                     
             except Exception as e:
                 print(f"PyAutoGUI failed: {e}")
@@ -4303,35 +5132,101 @@ class BiosensorApp(QMainWindow):
     
     def process_with_ocr(self, image_path: str):
         """Process image with Azure OCR API"""
+        pending_save = self._pending_saves.get(image_path)
+        unsaved = image_path in self._unsaved_captures
+        
         if not self.azure_api_key:
+            self._drop_unsaved_capture(image_path)
             self.update_status("❌ Azure API key not configured", "red")
             self.ocr_status_label.setText("⚠️ Please configure your Azure Computer Vision API key and endpoint in your .env file.")
-            self.ocr_status_label.setStyleSheet("""
-                QLabel {
-                    color: #FF5722;
-                    padding: 15px;
-                    background: rgba(255, 87, 34, 0.1);
-                    border: 2px solid #FF5722;
-                    border-radius: 8px;
-                    margin: 10px;
-                }
-            """)
+            self._set_label_state(self.ocr_status_label, "config")
             return
         
-        # Store current image path for potential deletion after CSV export
-        self.current_image_path = image_path
+        # Don't let slow OCR build up a backlog behind the capture loop
+        if not self._ocr_slots.tryAcquire():
+            if unsaved:
+                self._drop_unsaved_capture(image_path)
+                self.update_status("⏳ OCR busy - capture dropped (not saved, not OCR'd)", "orange")
+            else:
+                self.update_status("⏳ OCR busy - capture saved, OCR skipped", "orange")
+            return
+        
+        # An in-memory capture hands its encode future over to the OCR task and reports no file path
+        if unsaved:
+            self._unsaved_captures.discard(image_path)
+            self._pending_saves.pop(image_path, None)
+            image_path = ''
         
         self.update_status("🔄 Processing with OCR...", "blue")
         self.progress_bar.setVisible(True)
         self.progress_bar.setRange(0, 0)  # Indeterminate progress
         
-        # Start OCR worker thread
-        self.ocr_worker = OCRWorker(image_path, self.azure_api_key, self.azure_endpoint)
-        self.ocr_worker.finished.connect(self.on_ocr_finished)
-        self.ocr_worker.error.connect(self.on_ocr_error)
-        self.ocr_worker.start()
+        # Queue on the OCR pool (the task waits for any in-flight PNG encode of this image)
+        self._ocr_pool.start(OCRTask(self._ocr_signals, self._ocr_slots, image_path,
+                                     self.azure_api_key, self.azure_endpoint, pending_save,
+                                     self.ocr_max_dimension if self.ocr_downscale_enabled else None))
+    
+    def _drop_unsaved_capture(self, image_path: str):
+        """Forget an in-memory capture that won't be OCR'd, releasing its encoded upload"""
+        if image_path not in self._unsaved_captures:
+            return
+        self._unsaved_captures.discard(image_path)
+        pending_save = self._pending_saves.pop(image_path, None)
+        if pending_save is not None:
+            pending_save.cancel()  # Skips the encode if it hasn't started yet
+    
+    def on_ocr_task_finished(self, result: dict, image_path: str, ocr_scale: float):
+        """Handle a pooled OCR result, keeping it tied to the capture it came from"""
+        # Store current image path for potential deletion after CSV export (None if never saved)
+        self.current_image_path = image_path or None
+        self.on_ocr_finished(result, ocr_scale)
+    
+    def _ocr_in_flight(self) -> bool:
+        """True while any capture OCR (pooled or worker thread) is still running"""
+        return (self._ocr_pool.activeThreadCount() > 0
+                or bool(self.ocr_worker and self.ocr_worker.isRunning()))
+    
+    def queue_ocr_batch(self, image_path: str):
+        """Add an auto-capture to the pending OCR batch, sending it once full"""
+        self._ocr_batch.append(image_path)
+        if len(self._ocr_batch) >= self.ocr_batch_size:
+            self.flush_ocr_batch()
+        else:
+            self.update_status(f"🗂️ Queued for batch OCR ({len(self._ocr_batch)}/{self.ocr_batch_size})", "blue")
+            if not self._ocr_batch_timer.isActive():
+                self._ocr_batch_timer.start(OCR_BATCH_WINDOW_SECS * 1000)
+    
+    def flush_ocr_batch(self):
+        """Send the pending auto-captures to OCR in one batch"""
+        self._ocr_batch_timer.stop()
+        if not self._ocr_batch:
+            return
+        if self._ocr_batch_worker and self._ocr_batch_worker.isRunning():
+            self._ocr_batch_timer.start(500)  # Previous batch still in flight, retry shortly
+            return
+        if not self.azure_api_key:
+            self.update_status("❌ Azure API key not configured", "red")
+            return
+        
+        image_paths, self._ocr_batch = self._ocr_batch, []
+        self.update_status(f"🔄 Processing {len(image_paths)} captures with batch OCR...", "blue")
+        self.progress_bar.setVisible(True)
+        self.progress_bar.setRange(0, 0)  # Indeterminate progress
+        
+        self._ocr_batch_worker = BatchOCRWorker(image_paths, self.azure_api_key, self.azure_endpoint,
+                                                [self._pending_saves.get(path) for path in image_paths],
+                                                self.ocr_max_dimension if self.ocr_downscale_enabled else None)
+        self._ocr_batch_worker.finished.connect(self.on_ocr_batch_finished)
+        self._ocr_batch_worker.error.connect(self.on_ocr_error)
+        self._ocr_batch_worker.start()
+    
+    def on_ocr_batch_finished(self, results: list):
+        """Record each capture of a finished batch as if it had been OCR'd on its own"""
+        for image_path, result, ocr_scale in results:
+            self.current_image_path = image_path
+            self.on_ocr_finished(result, ocr_scale=ocr_scale)
     
-    def on_ocr_finished(self, result: Dict[Any, Any]):
+    def on_ocr_finished(self, result: Dict[Any, Any], ocr_scale: float = 1.0):
         """Handle successful OCR result"""
         self.progress_bar.setVisible(False)
         self.update_status("✅ OCR processing completed", "green")
@@ -4345,7 +5240,8 @@ class BiosensorApp(QMainWindow):
             'result': result,
             'raw_text': raw_text,
             'timestamp': timestamp,
-            'image_path': getattr(self, 'current_image_path', None)
+            'image_path': getattr(self, 'current_image_path', None),
+            'ocr_scale': ocr_scale  # OCR coords / image coords
         }
         
         # Enable export buttons
@@ -4368,52 +5264,19 @@ class BiosensorApp(QMainWindow):
     def extract_raw_text(self, ocr_result: Dict[Any, Any]) -> str:
         """Extract raw text from OCR result"""
         try:
-            raw_text_lines = []
-            
-            # Handle different Azure Computer Vision API response formats
-            if 'analyzeResult' in ocr_result:
-                # Document Intelligence / Read API v3.2+ format
-                analyze_result = ocr_result['analyzeResult']
-                if 'readResults' in analyze_result:
-                    for page in analyze_result['readResults']:
-                        for line in page.get('lines', []):
-                            raw_text_lines.append(line.get('text', ''))
-                elif 'pages' in analyze_result:
-                    for page in analyze_result['pages']:
-                        for line in page.get('lines', []):
-                            raw_text_lines.append(line.get('text', ''))
-            elif 'readResult' in ocr_result:
-                # Read API v3.0/3.1 format
-                for page in ocr_result['readResult']['pages']:
-                    for line in page.get('lines', []):
-                        raw_text_lines.append(line.get('text', ''))
-            elif 'regions' in ocr_result:
-                # OCR API v3.2 format (this is what we're actually using)
-                for region in ocr_result['regions']:
-                    for line in region.get('lines', []):
-                        # Extract text from words in each line
-                        line_text = ' '.join([word.get('text', '') for word in line.get('words', [])])
-                        if line_text.strip():
-                            raw_text_lines.append(line_text)
-            else:
-                # Fallback: recursively search for any 'text' fields
-                def find_text_recursive(obj, texts):
-                    if isinstance(obj, dict):
-                        # Look for 'text' field
-                        if 'text' in obj and isinstance(obj['text'], str) and obj['text'].strip():
-                            texts.append(obj['text'])
-                        # Look for 'content' field (alternative text field)
-                        elif 'content' in obj and isinstance(obj['content'], str) and obj['content'].strip():
-                            texts.append(obj['content'])
-                        # Recursively search in nested objects
-                        for key, value in obj.items():
-                            if key not in ['text', 'content']:  # Avoid duplicate processing
-                                find_text_recursive(value, texts)
-                    elif isinstance(obj, list):
-                        for item in obj:
-                            find_text_recursive(item, texts)
-                
-                find_text_recursive(ocr_result, raw_text_lines)
+            # Azure returns one response shape per endpoint, so reuse the extractor picked for
+            # the first response; a KeyError means the shape changed and it is detected afresh
+            extractor = self._ocr_extractor
+            if extractor is not None:
+                try:
+                    raw_text_lines = extractor(ocr_result)
+                except KeyError:
+                    extractor = None
+            if extractor is None:
+                extractor = _detect_ocr_extractor(ocr_result)
+                raw_text_lines = extractor(ocr_result)
+                # Extractors that accept any input can't signal a shape change, so they aren't remembered
+                self._ocr_extractor = extractor if extractor not in (_ocr_lines_any, _ocr_lines_none) else None
             
             # Clean and join the text lines
             clean_lines = [line.strip() for line in raw_text_lines if line.strip()]
@@ -4425,48 +5288,28 @@ class BiosensorApp(QMainWindow):
     def save_to_csv(self, raw_text: str, timestamp: str, image_path: str = None):
         """Save only raw data to CSV file in proper format"""
         try:
-            csv_file_path = os.path.join(self.csv_dir, "auto_data.csv")
-            
             # Get current window info
             window = self.get_selected_window()
             window_title = window.title if window else "Unknown"
             
-            # Prepare simplified CSV row data (only raw data)
-            csv_data = {
-                'timestamp': timestamp,
-                'window_title': window_title,
-                'raw_text': raw_text.replace('\n', ' | ') if raw_text.strip() else 'No text detected'
-            }
-            
-            # Check if file exists to determine if we need headers
-            file_exists = os.path.exists(csv_file_path)
-            
-            # Write to CSV file
-            with open(csv_file_path, 'a', newline='', encoding='utf-8') as csvfile:
-                fieldnames = ['timestamp', 'window_title', 'raw_text']
-                writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-                
-                # Write header if file is new
-                if not file_exists:
-                    writer.writeheader()
-                
-                # Write data row
-                writer.writerow(csv_data)
+            # Prepare simplified CSV row (only raw data) and append it to the open file
+            raw_field = raw_text.replace('\n', ' | ') if raw_text.strip() else 'No text detected'
+            os.write(self._get_auto_csv_fd(), _csv_line(timestamp, window_title, raw_field))
             
             self.update_status(f"📊 Raw data saved to auto_data.csv", "green")
             
             # Auto-delete screenshot after saving to CSV (with enhanced logging)
-            if image_path and os.path.exists(image_path):
+            if image_path:
                 try:
-                    print(f"DEBUG: Attempting to delete screenshot: {image_path}")
-                    os.remove(image_path)
+                    os.unlink(image_path)
                     print(f"DEBUG: Successfully deleted screenshot: {image_path}")
                     self.update_status(f"🗑️ Screenshot deleted: {os.path.basename(image_path)}", "gray")
+                except FileNotFoundError:
+                    print(f"DEBUG: Screenshot not deleted - already gone: {image_path}")
                 except Exception as delete_error:
                     print(f"DEBUG: Failed to delete screenshot: {str(delete_error)}")
                     self.update_status(f"⚠️ Could not delete screenshot: {str(delete_error)}", "orange")
-            else:
-                print(f"DEBUG: Screenshot not deleted - path: {image_path}, exists: {os.path.exists(image_path) if image_path else 'N/A'}")
+                self._screenshot_paths.discard(image_path)
             
         except Exception as e:
             self.update_status(f"❌ Failed to save CSV: {str(e)}", "red")
@@ -4474,14 +5317,6 @@ class BiosensorApp(QMainWindow):
     def save_manual_capture(self, raw_text: str, timestamp: str, image_path: str = None):
         """Save manual capture data to separate CSV and JSON files in dedicated directory"""
         try:
-            # Create manual captures directory
-            manual_images_dir = os.path.join(self.screenshots_dir, "manual_images")
-            manual_csv_dir = os.path.join(self.csv_dir, "manual_captures")
-            manual_json_dir = os.path.join(self.json_dir, "manual_captures")
-            os.makedirs(manual_images_dir, exist_ok=True)
-            os.makedirs(manual_csv_dir, exist_ok=True)
-            os.makedirs(manual_json_dir, exist_ok=True)
-            
             # Get window title
             window = self.get_selected_window()
             window_title = window.title if window else "Unknown"
@@ -4489,8 +5324,7 @@ class BiosensorApp(QMainWindow):
             # Save to separate CSV file for manual captures with dynamic filename
             timestamp_safe = timestamp.replace(':', '-').replace(' ', '_')
             csv_filename = f"manual_capture_{timestamp_safe}.csv"
-            csv_path = os.path.join(manual_csv_dir, csv_filename)
-            file_exists = os.path.exists(csv_path)
+            csv_path = os.path.join(self.manual_csv_dir, csv_filename)
             
             csv_data = {
                 'timestamp': timestamp,
@@ -4505,21 +5339,21 @@ class BiosensorApp(QMainWindow):
                 writer.writerow(csv_data)
             
             # Save to JSON file in manual captures directory
-            if hasattr(self, 'last_ocr_result') and self.last_ocr_result:
+            if self.last_ocr_result:
                 export_data = {
                     'timestamp': timestamp,
                     'window_title': window_title,
                     'raw_text': raw_text,
                     'full_ocr_result': self.last_ocr_result['result'],
+                    'ocr_scale': self.last_ocr_result.get('ocr_scale', 1.0),
                     'image_path': image_path
                 }
                 
                 json_timestamp_safe = timestamp.replace(':', '-').replace(' ', '_')
                 json_filename = f"manual_capture_{json_timestamp_safe}.json"
-                json_path = os.path.join(manual_json_dir, json_filename)
+                json_path = os.path.join(self.manual_json_dir, json_filename)
                 
-                with open(json_path, 'w', encoding='utf-8') as json_file:
-                    json.dump(export_data, json_file, indent=2, ensure_ascii=False)
+                _write_json(json_path, export_data)
                 
                 self.update_status(f"📋 Manual capture saved: {csv_filename} and {json_filename}", "green")
             else:
@@ -4535,36 +5369,46 @@ class BiosensorApp(QMainWindow):
         except Exception as e:
             self.update_status(f"❌ Failed to save manual capture: {str(e)}", "red")
     
+    def _get_auto_csv_fd(self) -> int:
+        """Open auto_data.csv for appending once, writing the header if the file is new"""
+        if self._auto_csv_fd is None:
+            fd = os.open(self.auto_csv_path, os.O_WRONLY | os.O_CREAT | os.O_APPEND | getattr(os, 'O_BINARY', 0), 0o644)
+            if os.fstat(fd).st_size == 0:
+                os.write(fd, AUTO_CSV_HEADER)
+            self._auto_csv_fd = fd
+        return self._auto_csv_fd
+    
+    def _seed_screenshot_heap(self):
+        """Index screenshots already in the capture directories (the only full scan)"""
+        for directory in (self.auto_images_dir, self.manual_images_dir):
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        if entry.name.lower().endswith(('.png', '.jpg', '.jpeg', '.bmp')) and entry.is_file():
+                            self._screenshot_heap.append((entry.stat().st_mtime, entry.path))
+                            self._screenshot_paths.add(entry.path)
+            except OSError as e:
+                print(f"DEBUG: Could not index screenshots in {directory}: {e}")
+        heapq.heapify(self._screenshot_heap)
+    
+    def _track_screenshot(self, filepath: str):
+        """Register a newly captured screenshot for cleanup"""
+        heapq.heappush(self._screenshot_heap, (time.time(), filepath))
+        self._screenshot_paths.add(filepath)
+    
+    def _pop_oldest_screenshot(self) -> Optional[str]:
+        """Pop the oldest still-tracked screenshot path, skipping entries deleted elsewhere"""
+        while self._screenshot_heap:
+            _, screenshot_path = heapq.heappop(self._screenshot_heap)
+            if screenshot_path in self._screenshot_paths:
+                self._screenshot_paths.discard(screenshot_path)
+                return screenshot_path
+        return None
+    
     def cleanup_old_screenshots(self):
         """Clean up old screenshots based on custom time interval or count"""
         try:
-            # Get all screenshot files in the auto and manual subdirectories
-            auto_images_dir = os.path.join(self.screenshots_dir, "auto_captures")
-            manual_images_dir = os.path.join(self.screenshots_dir, "manual_captures")
-            
-            screenshot_patterns = []
-            # Add patterns for auto-capture directory
-            if os.path.exists(auto_images_dir):
-                screenshot_patterns.extend([
-                    os.path.join(auto_images_dir, "*.png"),
-                    os.path.join(auto_images_dir, "*.jpg"),
-                    os.path.join(auto_images_dir, "*.jpeg"),
-                    os.path.join(auto_images_dir, "*.bmp")
-                ])
-            # Add patterns for manual capture directory
-            if os.path.exists(manual_images_dir):
-                screenshot_patterns.extend([
-                    os.path.join(manual_images_dir, "*.png"),
-                    os.path.join(manual_images_dir, "*.jpg"),
-                    os.path.join(manual_images_dir, "*.jpeg"),
-                    os.path.join(manual_images_dir, "*.bmp")
-                ])
-            
-            all_screenshots = []
-            for pattern in screenshot_patterns:
-                all_screenshots.extend(glob.glob(pattern))
-            
-            if len(all_screenshots) == 0:
+            if not self._screenshot_paths:
                 return  # No screenshots to clean up
             
             # Get deletion mode and settings
@@ -4575,51 +5419,27 @@ class BiosensorApp(QMainWindow):
             deleted_count = 0
             
             if deletion_mode == "time":
-                # Delete screenshots older than specified time interval
-                import time
-                current_time = time.time()
-                time_threshold = deletion_value * 60  # Convert minutes to seconds
-                
-                for screenshot_path in all_screenshots:
-                    try:
-                        file_modified_time = os.path.getmtime(screenshot_path)
-                        if (current_time - file_modified_time) > time_threshold:
-                            screenshots_to_delete.append(screenshot_path)
-                    except Exception as e:
-                        print(f"DEBUG: Error checking file time for {screenshot_path}: {e}")
-                
-                # Delete old screenshots
-                for screenshot_path in screenshots_to_delete:
-                    try:
-                        os.remove(screenshot_path)
-                        deleted_count += 1
-                        print(f"DEBUG: Cleaned up old screenshot (time-based): {os.path.basename(screenshot_path)}")
-                    except Exception as delete_error:
-                        print(f"DEBUG: Failed to delete old screenshot {screenshot_path}: {delete_error}")
-                
-                if deleted_count > 0:
-                    self.update_status(f"🧹 Cleaned up {deleted_count} screenshots older than {deletion_value} minutes", "blue")
-                
+                # Delete screenshots older than specified time interval (oldest sit at the heap root)
+                cutoff = time.time() - deletion_value * 60  # Convert minutes to seconds
+                while self._screenshot_heap and self._screenshot_heap[0][0] < cutoff:
+                    screenshot_path = self._pop_oldest_screenshot()
+                    if screenshot_path:
+                        screenshots_to_delete.append(screenshot_path)
+                mode_label = "time-based"
             else:  # count mode
                 # Keep only the most recent N screenshots
-                if len(all_screenshots) <= deletion_value:
-                    return  # No cleanup needed
-                
-                # Sort by modification time (newest first)
-                all_screenshots.sort(key=lambda x: os.path.getmtime(x), reverse=True)
-                
-                # Keep only the first N (newest), delete the rest
-                screenshots_to_delete = all_screenshots[deletion_value:]
-                
-                for screenshot_path in screenshots_to_delete:
-                    try:
-                        os.remove(screenshot_path)
-                        deleted_count += 1
-                        print(f"DEBUG: Cleaned up old screenshot (count-based): {os.path.basename(screenshot_path)}")
-                    except Exception as delete_error:
-                        print(f"DEBUG: Failed to delete old screenshot {screenshot_path}: {delete_error}")
-                
-                if deleted_count > 0:
+                while len(self._screenshot_paths) > deletion_value:
+                    screenshots_to_delete.append(self._pop_oldest_screenshot())
+                mode_label = "count-based"
+            
+            if screenshots_to_delete:
+                deleted_count = bulk_unlink(screenshots_to_delete)
+                print(f"DEBUG: Cleaned up {deleted_count} old screenshot(s) ({mode_label})")
+            
+            if deleted_count > 0:
+                if deletion_mode == "time":
+                    self.update_status(f"🧹 Cleaned up {deleted_count} screenshots older than {deletion_value} minutes", "blue")
+                else:
                     self.update_status(f"🧹 Cleaned up {deleted_count} old screenshots (keeping last {deletion_value} files)", "blue")
                 
         except Exception as e:
@@ -4640,163 +5460,158 @@ class BiosensorApp(QMainWindow):
             window = self.get_selected_window()
             window_title = window.title if window else "Unknown"
             
-            # USB STABILITY: Use managed delay based on device type
-            if hasattr(self, 'usb_stability_manager'):
-                stability_delay = self.usb_stability_manager.operation_delays.get('file_write', 0.2)
-                time.sleep(stability_delay)
-            else:
-                time.sleep(0.1)
-            
-            # Save to CSV with proper error handling
-            csv_path = os.path.join(self.csv_dir, "auto_data.csv")
-            file_exists = os.path.exists(csv_path)
-            
-            csv_data = {
-                'timestamp': timestamp,
-                'window_title': window_title,
-                'raw_text': raw_text.replace('\n', ' | ') if raw_text.strip() else 'No text detected'
-            }
-            
-            try:
-                with open(csv_path, 'a', newline='', encoding='utf-8') as csvfile:
-                    fieldnames = ['timestamp', 'window_title', 'raw_text']
-                    writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-                    if not file_exists:
-                        writer.writeheader()
-                    writer.writerow(csv_data)
-                    csvfile.flush()  # Ensure data is written immediately
-                    
-            except Exception as csv_error:
-                print(f"DEBUG: CSV write error: {csv_error}")
-                self.update_status(f"⚠️ CSV save failed: {str(csv_error)}", "orange")
-                return  # Don't continue if CSV fails
+            csv_path = self.auto_csv_path
+            raw_field = raw_text.replace('\n', ' | ') if raw_text.strip() else 'No text detected'
+            csv_line = _csv_line(timestamp, window_title, raw_field)
             
-            # USB STABILITY FIX 2: Delay between major file operations
-            time.sleep(0.15)
+            json_path = None
+            export_data = None
+            if self.last_ocr_result:
+                export_data = {
+                    'timestamp': timestamp,
+                    'window_title': window_title,
+                    'raw_text': raw_text,
+                    'full_ocr_result': self.last_ocr_result['result'],
+                    'ocr_scale': self.last_ocr_result.get('ocr_scale', 1.0),
+                    'image_path': image_path
+                }
+                timestamp_safe = timestamp.replace(':', '-').replace(' ', '_')
+                json_path = os.path.join(self.json_dir, f"auto_capture_{timestamp_safe}.json")
             
-            # Save to JSON (only if CSV succeeded)
-            json_saved = False
-            if hasattr(self, 'last_ocr_result') and self.last_ocr_result:
+            if PLATFORM == 'linux':
+                # Hand both records to the ordered writer thread; no stability pauses needed
+                future = self._io_pool.submit(_write_auto_records, self._get_auto_csv_fd(), csv_line,
+                                              json_path, export_data)
+                future.add_done_callback(self._report_write_error)
+                saved_names = os.path.basename(csv_path)
+                if json_path:
+                    saved_names += f", {os.path.basename(json_path)}"
+                self.update_status(f"💾 Auto-save queued: {saved_names}", "green")
+            else:
+                # USB STABILITY: Wait out a recent disturbance (returns at once when settled)
+                self.usb_stability_manager.wait_settled('file_write')
+                
+                # Save to CSV with proper error handling
                 try:
-                    export_data = {
-                        'timestamp': timestamp,
-                        'window_title': window_title,
-                        'raw_text': raw_text,
-                        'full_ocr_result': self.last_ocr_result['result'],
-                        'image_path': image_path
-                    }
-                    
-                    timestamp_safe = timestamp.replace(':', '-').replace(' ', '_')
-                    json_filename = f"auto_capture_{timestamp_safe}.json"
-                    json_path = os.path.join(self.json_dir, json_filename)
-                    
-                    with open(json_path, 'w', encoding='utf-8') as json_file:
-                        json.dump(export_data, json_file, indent=2, ensure_ascii=False)
-                        json_file.flush()  # Ensure data is written immediately
-                    
-                    json_saved = True
-                    self.update_status(f"💾 Auto-saved to CSV and JSON: {os.path.basename(csv_path)}, {json_filename}", "green")
-                    
-                except Exception as json_error:
-                    print(f"DEBUG: JSON write error: {json_error}")
-                    self.update_status(f"💾 CSV saved successfully, JSON failed: {str(json_error)}", "orange")
-            
-            if not json_saved:
-                self.update_status(f"💾 Auto-saved to CSV: {os.path.basename(csv_path)}", "green")
+                    _write_auto_records(self._get_auto_csv_fd(), csv_line)
+                except Exception as csv_error:
+                    print(f"DEBUG: CSV write error: {csv_error}")
+                    self.update_status(f"⚠️ CSV save failed: {str(csv_error)}", "orange")
+                    return  # Don't continue if CSV fails
+                
+                # Save to JSON (only if CSV succeeded)
+                json_saved = False
+                if json_path:
+                    try:
+                        _write_json(json_path, export_data)
+                        
+                        json_saved = True
+                        self.update_status(f"💾 Auto-saved to CSV and JSON: {os.path.basename(csv_path)}, {os.path.basename(json_path)}", "green")
+                        
+                    except Exception as json_error:
+                        print(f"DEBUG: JSON write error: {json_error}")
+                        self.update_status(f"💾 CSV saved successfully, JSON failed: {str(json_error)}", "orange")
+                
+                if not json_saved:
+                    self.update_status(f"💾 Auto-saved to CSV: {os.path.basename(csv_path)}", "green")
             
-            # USB STABILITY: Use managed delay before cleanup operations
-            if hasattr(self, 'usb_stability_manager'):
-                cleanup_delay = self.usb_stability_manager.operation_delays.get('cleanup', 0.5)
-                time.sleep(cleanup_delay)
-            else:
-                time.sleep(0.2)
+            # USB STABILITY: Wait out a recent disturbance before cleanup operations
+            self.usb_stability_manager.wait_settled('cleanup')
             
             # Clean up old screenshots with USB stability-aware frequency
-            if not hasattr(self, '_cleanup_counter'):
-                self._cleanup_counter = 0
             self._cleanup_counter += 1
             
             # Get optimal cleanup frequency from USB stability manager
-            cleanup_frequency = 10  # Default
-            if hasattr(self, 'usb_stability_manager'):
-                cleanup_frequency = self.usb_stability_manager.get_optimal_cleanup_frequency()
+            cleanup_frequency = self.usb_stability_manager.get_optimal_cleanup_frequency()
             
             if self._cleanup_counter % cleanup_frequency == 0:
                 try:
-                    if hasattr(self, 'usb_stability_manager'):
-                        self.usb_stability_manager.safe_cleanup(self.cleanup_old_screenshots)
-                    else:
-                        self.cleanup_old_screenshots()
+                    self.usb_stability_manager.safe_cleanup(self.cleanup_old_screenshots)
                 except Exception as cleanup_error:
                     print(f"DEBUG: Screenshot cleanup error: {cleanup_error}")
                     # Don't fail the operation if cleanup fails
             
             # USB STABILITY: Intelligent screenshot deletion management
-            auto_delete_enabled = getattr(self, 'enable_auto_delete_screenshots', False)
-            
-            if auto_delete_enabled and image_path and os.path.exists(image_path):
-                # Check if we should skip deletion for USB stability
-                if hasattr(self, 'usb_stability_manager') and self.usb_stability_manager.should_skip_operation('file_delete'):
-                    print(f"DEBUG: Screenshot deletion skipped for USB stability: {image_path}")
-                    if self._cleanup_counter % 5 == 0:
-                        self.update_status(f"🔌 Screenshot deletion skipped for USB stability", "blue")
-                else:
-                    try:
-                        # Use USB stability manager for safe deletion
-                        if hasattr(self, 'usb_stability_manager'):
-                            success = self.usb_stability_manager.safe_file_delete(image_path)
-                            if success:
-                                print(f"DEBUG: Screenshot safely deleted: {image_path}")
-                                self.update_status(f"🗑️ Screenshot auto-deleted: {os.path.basename(image_path)}", "gray")
-                            else:
-                                print(f"DEBUG: Screenshot not found for deletion: {image_path}")
-                        else:
-                            # Fallback to regular deletion with delay
-                            time.sleep(0.3)
-                            os.remove(image_path)
-                            print(f"DEBUG: Screenshot deleted successfully: {image_path}")
-                            self.update_status(f"🗑️ Screenshot auto-deleted: {os.path.basename(image_path)}", "gray")
-                    except Exception as delete_error:
-                        print(f"DEBUG: Failed to delete screenshot: {image_path}, Error: {delete_error}")
-                        # Don't fail the entire operation if deletion fails
-                        self.update_status(f"⚠️ Screenshot deletion failed, continuing...", "orange")
-            elif image_path and os.path.exists(image_path):
-                if not auto_delete_enabled:
-                    print(f"DEBUG: Auto-deletion disabled for USB stability - preserving: {image_path}")
-                    # Only show this message occasionally to avoid spam
-                    if self._cleanup_counter % 5 == 0:
-                        stability_status = ""
-                        if hasattr(self, 'usb_stability_manager'):
-                            stability_status = f" ({self.usb_stability_manager.get_status_message()})"
-                        self.update_status(f"💾 Screenshots preserved (auto-delete disabled){stability_status}", "blue")
-                else:
-                    print(f"DEBUG: Screenshot not found for deletion - path: {image_path}")
+            auto_delete_enabled = self.enable_auto_delete_screenshots
+            
+            if auto_delete_enabled and image_path:
+                # Hand off to the batch delete worker (USB stability gating and missing files handled there)
+                self._screenshot_paths.discard(image_path)
+                self._pending_deletes.append(image_path)
+                if len(self._pending_deletes) >= DELETE_BATCH_SIZE:
+                    self._delete_wakeup.set()
+            elif image_path:
+                print(f"DEBUG: Auto-deletion disabled for USB stability - preserving: {image_path}")
+                # Only show this message occasionally to avoid spam
+                if self._cleanup_counter % 5 == 0:
+                    stability_status = f" ({self.usb_stability_manager.get_status_message()})"
+                    self.update_status(f"💾 Screenshots preserved (auto-delete disabled){stability_status}", "blue")
             
         except Exception as e:
             print(f"DEBUG: Critical error in save_auto_data: {e}")
             self.update_status(f"❌ Failed to save auto data: {str(e)}", "red")
     
+    def _delete_worker_loop(self):
+        """Background loop that flushes queued screenshot deletions every few seconds or per full batch"""
+        while True:
+            self._delete_wakeup.wait(timeout=DELETE_FLUSH_INTERVAL_SECS)
+            self._delete_wakeup.clear()
+            self._flush_pending_deletes()
+            if self._delete_stop:
+                return
+    
+    def _flush_pending_deletes(self):
+        """Unlink queued screenshots in batches and report one count for the whole sweep"""
+        deleted = 0
+        while self._pending_deletes:
+            if self.usb_stability_manager.should_skip_operation('file_delete'):
+                skipped = len(self._pending_deletes)
+                self._pending_deletes.clear()
+                print(f"DEBUG: Screenshot deletion skipped for USB stability: {skipped} file(s)")
+                break
+            batch = [self._pending_deletes.popleft()
+                     for _ in range(min(len(self._pending_deletes), DELETE_BATCH_SIZE))]
+            deleted += bulk_unlink(batch)
+        if deleted:
+            self.screenshots_deleted.emit(deleted)
+    
+    def on_screenshots_deleted(self, count: int):
+        """Report a finished batch of screenshot deletions"""
+        print(f"DEBUG: Batch-deleted {count} screenshot(s)")
+        self.update_status(f"🗑️ Screenshots auto-deleted: {count}", "gray")
+    
+    def _message(self, icon, title: str, text: str):
+        """Show a modal message through the pooled QMessageBox for `icon`"""
+        box = self._message_boxes.get(icon)
+        if box is None or box.isVisible():
+            # A fresh box if this severity's pooled one is already on screen (nested message)
+            box = QMessageBox(icon, '', '', QMessageBox.Ok, self)
+            self._message_boxes.setdefault(icon, box)
+        box.setWindowTitle(title)
+        box.setText(text)
+        return box.exec_()
+    
+    @staticmethod
+    def _set_label_state(label, state: str):
+        """Switch a label's "state" property and re-polish it (no-op if the state is unchanged)"""
+        if label.property("state") != state:
+            label.setProperty("state", state)
+            style = label.style()
+            style.unpolish(label)
+            style.polish(label)
+    
     def on_ocr_error(self, error_message: str):
         """Handle OCR error"""
         self.progress_bar.setVisible(False)
         self.update_status(f"❌ OCR Error", "red")
         self.ocr_status_label.setText(f"❌ OCR Error: {error_message}")
-        self.ocr_status_label.setStyleSheet("""
-            QLabel {
-                color: #F44336;
-                padding: 15px;
-                background: rgba(244, 67, 54, 0.1);
-                border: 2px solid #F44336;
-                border-radius: 8px;
-                margin: 10px;
-            }
-        """)
+        self._set_label_state(self.ocr_status_label, "error")
         self.quick_stats_label.setText("")
     
     def capture_background_window(self):
         """Capture the selected window in background without activating it"""
         # Start performance tracking
-        capture_start_time = time.time()
+        capture_start_time = time.perf_counter()
         
         # Add task to navigation queue
         task_name = "Background Screenshot Capture"
@@ -4814,41 +5629,39 @@ class BiosensorApp(QMainWindow):
                 if "Select a window" in current_text or "No windows found" in current_text:
                     self.update_status("❌ Please select a valid window first", "red")
                     self.complete_task(task_name, False)
-                    QMessageBox.warning(self, "No Window Selected", 
-                                      "Please select a valid window from the dropdown list.\n\n" +
-                                      "If you don't see your device window:\n" +
-                                      "1. Make sure your device/app is running\n" +
-                                      "2. Click the 'Refresh' button\n" +
-                                      "3. Look for your device in the Mobile/Device section")
+                    self._message(QMessageBox.Warning, "No Window Selected", 
+                                "Please select a valid window from the dropdown list.\n\n" +
+                                "If you don't see your device window:\n" +
+                                "1. Make sure your device/app is running\n" +
+                                "2. Click the 'Refresh' button\n" +
+                                "3. Look for your device in the Mobile/Device section")
                 else:
                     self.update_status("❌ Invalid window selection", "red")
                     self.complete_task(task_name, False)
-                    QMessageBox.warning(self, "Invalid Selection", 
-                                      "The selected item is not a valid window. Please choose a window from the list.")
+                    self._message(QMessageBox.Warning, "Invalid Selection", 
+                                "The selected item is not a valid window. Please choose a window from the list.")
                 return
             
             self.update_task_progress(20, "Validating window")
             
             # Verify window is still valid
             try:
-                width = getattr(window, 'width', getattr(window, 'size', [0, 0])[0] if hasattr(window, 'size') else 0)
-                height = getattr(window, 'height', getattr(window, 'size', [0, 0])[1] if hasattr(window, 'size') else 0)
-                visible = getattr(window, 'visible', getattr(window, 'isVisible', True))
+                view = _window_view(window)
                 
-                if not visible or width <= 0 or height <= 0:
+                if not view.visible or view.width <= 0 or view.height <= 0:
                     self.update_status("❌ Selected window is no longer valid", "red")
                     self.complete_task(task_name, False)
-                    QMessageBox.warning(self, "Window Not Available", 
-                                      "The selected window is no longer available. Please refresh the list and select again.")
+                    self._message(QMessageBox.Warning, "Window Not Available", 
+                                "The selected window is no longer available. Please refresh the list and select again.")
                     return
             except:
                 self.update_status("❌ Selected window is no longer accessible", "red")
                 self.complete_task(task_name, False)
-                QMessageBox.warning(self, "Window Error", 
-                                  "Cannot access the selected window. Please refresh the list and try again.")
+                self._message(QMessageBox.Warning, "Window Error", 
+                            "Cannot access the selected window. Please refresh the list and try again.")
                 return
             
-            self.update_status(f"✅ Selected window: {window.title} - Background capture mode", "green")
+            self.update_status(f"✅ Selected window: {view.title} - Background capture mode", "green")
             self.update_task_progress(30, "Window validated")
             
             # Step 2: Take background screenshot (no activation)
@@ -4857,24 +5670,25 @@ class BiosensorApp(QMainWindow):
             if not image_path:
                 self.complete_task(task_name, False)
                 return
+            if image_path not in self._unsaved_captures:
+                self._track_screenshot(image_path)
             
             self.update_task_progress(60, "Background screenshot captured")
             
-            # Step 3: Process with OCR
+            # Step 3: Process with OCR (auto-captures may be batched into one request)
             self.update_task_progress(70, "Starting OCR")
-            self.process_with_ocr(image_path)
+            if self.ocr_batch_size > 1 and self.auto_checkbox.isChecked():
+                self.queue_ocr_batch(image_path)
+            else:
+                self.process_with_ocr(image_path)
             
             # Update performance metrics for auto capture
             self.total_captures += 1
             self.auto_captures += 1
-            processing_time = time.time() - capture_start_time
+            processing_time = time.perf_counter() - capture_start_time
             self.total_processing_time += processing_time
             self.auto_processing_time += processing_time
-            self.auto_capture_times.append(processing_time)
-            
-            # Keep only last 50 measurements
-            if len(self.auto_capture_times) > 50:
-                self.auto_capture_times = self.auto_capture_times[-50:]
+            self.auto_capture_times.append(processing_time)  # deque drops anything past the last 50
             
             self.complete_task(task_name, True)
             
@@ -4885,7 +5699,7 @@ class BiosensorApp(QMainWindow):
     def capture_selected_window(self):
         """Capture the selected window with USB stability fix and navigation alerts"""
         # Start performance tracking
-        capture_start_time = time.time()
+        capture_start_time = time.perf_counter()
         
         # Add task to navigation queue
         task_name = "Manual Screenshot Capture"
@@ -4906,17 +5720,17 @@ class BiosensorApp(QMainWindow):
                 if "Select a window" in current_text or "No windows found" in current_text:
                     self.update_status("❌ Please select a valid window first", "red")
                     self.complete_task(task_name, False)
-                    QMessageBox.warning(self, "No Window Selected", 
-                                      "Please select a valid window from the dropdown list.\n\n" +
-                                      "If you don't see your device window:\n" +
-                                      "1. Make sure your device/app is running\n" +
-                                      "2. Click the 'Refresh' button\n" +
-                                      "3. Look for your device in the Mobile/Device section")
+                    self._message(QMessageBox.Warning, "No Window Selected", 
+                                "Please select a valid window from the dropdown list.\n\n" +
+                                "If you don't see your device window:\n" +
+                                "1. Make sure your device/app is running\n" +
+                                "2. Click the 'Refresh' button\n" +
+                                "3. Look for your device in the Mobile/Device section")
                 else:
                     self.update_status("❌ Invalid window selection", "red")
                     self.complete_task(task_name, False)
-                    QMessageBox.warning(self, "Invalid Selection", 
-                                      "The selected item is not a valid window. Please choose a window from the list.")
+                    self._message(QMessageBox.Warning, "Invalid Selection", 
+                                "The selected item is not a valid window. Please choose a window from the list.")
                 return
             
             self.update_task_progress(20, "Validating window")
@@ -4926,14 +5740,14 @@ class BiosensorApp(QMainWindow):
                 if not window.visible or window.width <= 0 or window.height <= 0:
                     self.update_status("❌ Selected window is no longer valid", "red")
                     self.complete_task(task_name, False)
-                    QMessageBox.warning(self, "Window Not Available", 
-                                      "The selected window is no longer available. Please refresh the list and select again.")
+                    self._message(QMessageBox.Warning, "Window Not Available", 
+                                "The selected window is no longer available. Please refresh the list and select again.")
                     return
             except:
                 self.update_status("❌ Selected window is no longer accessible", "red")
                 self.complete_task(task_name, False)
-                QMessageBox.warning(self, "Window Error", 
-                                  "Cannot access the selected window. Please refresh the list and try again.")
+                self._message(QMessageBox.Warning, "Window Error", 
+                            "Cannot access the selected window. Please refresh the list and try again.")
                 return
             
             self.update_status(f"✅ Selected window: {window.title}", "green")
@@ -4955,14 +5769,10 @@ class BiosensorApp(QMainWindow):
             # Update performance metrics for manual capture
             self.total_captures += 1
             self.manual_captures += 1
-            processing_time = time.time() - capture_start_time
+            processing_time = time.perf_counter() - capture_start_time
             self.total_processing_time += processing_time
             self.manual_processing_time += processing_time
-            self.manual_capture_times.append(processing_time)
-            
-            # Keep only last 50 measurements
-            if len(self.manual_capture_times) > 50:
-                self.manual_capture_times = self.manual_capture_times[-50:]
+            self.manual_capture_times.append(processing_time)  # deque drops anything past the last 50
             
         except Exception as e:
             self.update_status(f"❌ Capture failed: {str(e)}", "red")
@@ -4983,13 +5793,12 @@ class BiosensorApp(QMainWindow):
             window = self.get_selected_window()
             if window:
                 # Optimize USB stability for the selected device
-                if hasattr(self, 'usb_stability_manager'):
-                    self.usb_stability_manager.optimize_for_device(window.title)
-                    
-                    # Check if we should skip this operation for USB stability
-                    if self.usb_stability_manager.should_skip_operation('auto_capture'):
-                        self.update_status("🔌 Auto-capture skipped for USB stability", "blue")
-                        return
+                self.usb_stability_manager.optimize_for_device(window.title)
+                
+                # Check if we should skip this operation for USB stability
+                if self.usb_stability_manager.should_skip_operation('auto_capture'):
+                    self.update_status("🔌 Auto-capture skipped for USB stability", "blue")
+                    return
                 
                 # Use background capture for auto-capture to avoid interrupting user workflow
                 self.capture_background_window()
@@ -5065,29 +5874,26 @@ class BiosensorApp(QMainWindow):
             self.deletion_interval_spinbox.setToolTip("Number of most recent screenshots to keep")
         
         # Update status if auto-deletion is enabled
-        if hasattr(self, 'enable_auto_delete_screenshots') and self.enable_auto_delete_screenshots:
+        if self.enable_auto_delete_screenshots:
             self.toggle_usb_stability(Qt.Checked)
     
     def toggle_usb_stability_mode(self):
         """Toggle between maximum USB stability mode and fast mode"""
-        if hasattr(self, 'usb_stability_manager'):
-            if self.usb_stability_btn.isChecked():
-                self.usb_stability_manager.enable_stability_mode()
-                self.usb_stability_btn.setText("🔌 Max USB Stability")
-                self.update_status("🔌 Maximum USB stability mode enabled - prevents disconnections", "green")
-            else:
-                self.usb_stability_manager.disable_stability_mode()
-                self.usb_stability_btn.setText("⚡ Fast Mode")
-                self.update_status("⚡ Fast mode enabled - faster operations but may cause USB issues", "orange")
+        if self.usb_stability_btn.isChecked():
+            self.usb_stability_manager.enable_stability_mode()
+            self.usb_stability_btn.setText("🔌 Max USB Stability")
+            self.update_status("🔌 Maximum USB stability mode enabled - prevents disconnections", "green")
         else:
-            self.update_status("⚠️ USB Stability Manager not available", "red")
+            self.usb_stability_manager.disable_stability_mode()
+            self.usb_stability_btn.setText("⚡ Fast Mode")
+            self.update_status("⚡ Fast mode enabled - faster operations but may cause USB issues", "orange")
     
     # launch_background_service method removed to prevent unwanted background captures
     
     def export_last_result_to_csv(self):
         """Export the last OCR result to CSV manually"""
-        if not hasattr(self, 'last_ocr_result') or not self.last_ocr_result:
-            QMessageBox.warning(self, "No Data", "No OCR result available to export. Please capture a window first.")
+        if not self.last_ocr_result:
+            self._message(QMessageBox.Warning, "No Data", "No OCR result available to export. Please capture a window first.")
             return
         
         try:
@@ -5099,17 +5905,16 @@ class BiosensorApp(QMainWindow):
             self.save_to_csv(raw_text, timestamp, None)  # Don't delete screenshot for manual export
             
             # Show success message
-            csv_path = os.path.join(self.csv_dir, "auto_data.csv")
-            QMessageBox.information(self, "Export Successful", 
-                                  f"Raw data exported to CSV successfully!\n\nFile location:\n{csv_path}")
+            self._message(QMessageBox.Information, "Export Successful", 
+                        f"Raw data exported to CSV successfully!\n\nFile location:\n{self.auto_csv_path}")
             
         except Exception as e:
-            QMessageBox.critical(self, "Export Error", f"Failed to export to CSV:\n{str(e)}")
+            self._message(QMessageBox.Critical, "Export Error", f"Failed to export to CSV:\n{str(e)}")
     
     def export_last_result_to_json(self):
         """Export the last OCR result to JSON file"""
-        if not hasattr(self, 'last_ocr_result') or not self.last_ocr_result:
-            QMessageBox.warning(self, "No Data", "No OCR result available to export. Please capture a window first.")
+        if not self.last_ocr_result:
+            self._message(QMessageBox.Warning, "No Data", "No OCR result available to export. Please capture a window first.")
             return
         
         try:
@@ -5119,6 +5924,7 @@ class BiosensorApp(QMainWindow):
                 'window_title': self.get_selected_window().title if self.get_selected_window() else "Unknown",
                 'raw_text': self.last_ocr_result['raw_text'],
                 'full_ocr_result': self.last_ocr_result['result'],
+                'ocr_scale': self.last_ocr_result.get('ocr_scale', 1.0),
                 'image_path': self.last_ocr_result.get('image_path', None)
             }
             
@@ -5127,33 +5933,42 @@ class BiosensorApp(QMainWindow):
             json_filename = f"ocr_export_{timestamp_safe}.json"
             json_path = os.path.join(self.json_dir, json_filename)
             
-            # Write JSON file
-            with open(json_path, 'w', encoding='utf-8') as json_file:
-                json.dump(export_data, json_file, indent=2, ensure_ascii=False)
-            
-            # Show success message
-            QMessageBox.information(self, "Export Successful", 
-                                  f"OCR data exported to JSON successfully!\n\nFile location:\n{json_path}")
-            
-            self.update_status(f"📄 JSON exported: {json_filename}", "green")
+            # Write JSON file on the writer thread; on_json_exported reports the outcome
+            future = self._io_pool.submit(_write_json, json_path, export_data)
+            future.add_done_callback(
+                lambda f: self.json_export_finished.emit(json_path, str(f.exception() or '')))
+            self.update_status(f"📄 Exporting JSON: {json_filename}", "blue")
             
         except Exception as e:
-            QMessageBox.critical(self, "Export Error", f"Failed to export to JSON:\n{str(e)}")
+            self._message(QMessageBox.Critical, "Export Error", f"Failed to export to JSON:\n{str(e)}")
+    
+    def _report_write_error(self, future):
+        """Done-callback for queued auto-save writes: hand failures to the GUI thread"""
+        error = future.exception()
+        if error is not None:
+            print(f"DEBUG: Queued auto-data write failed: {error}")
+            self.auto_save_failed.emit(str(error))
+    
+    def on_auto_save_failed(self, error: str):
+        """Report a queued auto-save that failed on the writer thread"""
+        self.update_status(f"⚠️ Auto-save failed: {error}", "orange")
+    
+    def on_json_exported(self, json_path: str, error: str):
+        """Report a finished background JSON export"""
+        if error:
+            self._message(QMessageBox.Critical, "Export Error", f"Failed to export to JSON:\n{error}")
+            return
+        
+        # Show success message
+        self._message(QMessageBox.Information, "Export Successful", 
+                    f"OCR data exported to JSON successfully!\n\nFile location:\n{json_path}")
+        
+        self.update_status(f"📄 JSON exported: {os.path.basename(json_path)}", "green")
     
     def clear_results(self):
         """Clear the results preview and reset UI"""
         self.ocr_status_label.setText("No OCR results yet. Capture a window to see results.")
-        self.ocr_status_label.setStyleSheet("""
-            QLabel {
-                color: #888;
-                padding: 20px;
-                text-align: center;
-                background: rgba(255, 255, 255, 0.05);
-                border: 2px dashed #555;
-                border-radius: 8px;
-                margin: 10px;
-            }
-        """)
+        self._set_label_state(self.ocr_status_label, "empty")
         self.quick_stats_label.setText("")
         self.csv_export_btn.setEnabled(False)
         self.json_export_btn.setEnabled(False)
@@ -5175,8 +5990,7 @@ class BiosensorApp(QMainWindow):
         self.json_export_btn.setEnabled(False)
         
         # Clear last result
-        if hasattr(self, 'last_ocr_result'):
-            self.last_ocr_result = None
+        self.last_ocr_result = None
     
     def zoom_in(self):
         """Zoom in the main application"""
@@ -5197,28 +6011,19 @@ class BiosensorApp(QMainWindow):
         # Update zoom label
         self.zoom_label.setText(f"{int(self.zoom_level * 100)}%")
         
-        # Apply zoom transformation to the central widget
-        transform = QTransform()
-        transform.scale(self.zoom_level, self.zoom_level)
-        
-        # Get the central widget and apply transformation
-        central_widget = self.centralWidget()
-        if central_widget:
-            # Create a graphics effect for zoom
-            font = central_widget.font()
-            original_size = 9  # Base font size
-            new_size = int(original_size * self.zoom_level)
-            font.setPointSize(max(6, min(new_size, 24)))  # Clamp between 6 and 24
-            
-            # Apply font changes to main elements
-            for widget in central_widget.findChildren(QWidget):
-                if hasattr(widget, 'setFont'):
-                    widget_font = widget.font()
-                    if widget_font.pointSize() > 0:
-                        base_size = 9 if widget_font.pointSize() <= 12 else 12
-                        new_widget_size = int(base_size * self.zoom_level)
-                        widget_font.setPointSize(max(6, min(new_widget_size, 24)))
-                        widget.setFont(widget_font)
+        # Debounce: holding zoom in/out restyles once, not on every step
+        if not self._zoom_apply_pending:
+            self._zoom_apply_pending = True
+            QTimer.singleShot(50, self._apply_zoom_stylesheet)
+    
+    def _apply_zoom_stylesheet(self):
+        """Let Qt's style engine resize every font via one application-wide rule"""
+        self._zoom_apply_pending = False
+        if round(self.zoom_level, 2) == 1.0:
+            QApplication.instance().setStyleSheet(self._base_stylesheet)
+            return
+        point_size = max(6, min(int(9 * self.zoom_level), 24))  # Clamp between 6 and 24
+        QApplication.instance().setStyleSheet(self._base_stylesheet + f"\n* {{ font-size: {point_size}pt; }}")
     
     def open_developer_website(self):
         """Open developer website in default browser"""
@@ -5242,6 +6047,40 @@ class BiosensorApp(QMainWindow):
         if self.ocr_worker and self.ocr_worker.isRunning():
             self.ocr_worker.quit()
             self.ocr_worker.wait()
+        self._ocr_pool.waitForDone()
+        self._ocr_batch_timer.stop()
+        if self._ocr_batch_worker and self._ocr_batch_worker.isRunning():
+            self._ocr_batch_worker.wait()
+        if self._ocr_batch:
+            # Send the captures still waiting for a full batch rather than dropping them
+            QApplication.processEvents()  # Record the previous batch before starting the next
+            self.flush_ocr_batch()
+            if self._ocr_batch_worker and self._ocr_batch_worker.isRunning():
+                self._ocr_batch_worker.wait()
+        QApplication.processEvents()  # Deliver the batch results before the record writers stop
+        for sct in self._mss_instances:
+            try:
+                sct.close()
+            except Exception as e:
+                print(f"DEBUG: Error closing MSS instance: {e}")
+        self._mss_instances.clear()
+        if self._dxcam is not None:
+            self._dxcam.release()
+            self._dxcam = None
+        if self._xdisplay is not None:
+            self._xdisplay.close()
+            self._xdisplay = None
+        self._encode_pool.shutdown(wait=True)  # Finish writing queued screenshots
+        self._io_pool.shutdown(wait=True)  # Flush queued CSV/JSON records
+        if self._mss_speculation is not None:
+            self._mss_speculation.cancel()  # No one is waiting on a queued speculative grab
+        self._capture_pool.shutdown(wait=True)
+        self._delete_stop = True
+        self._delete_wakeup.set()
+        self._delete_worker.join()  # Final sweep of queued screenshot deletions
+        if self._auto_csv_fd is not None:
+            os.close(self._auto_csv_fd)
+            self._auto_csv_fd = None
         event.accept()
 
 
@@ -5274,29 +6113,11 @@ def main():
     def set_application_icon():
         """Set the application icon for Windows taskbar"""
         try:
-            # Multiple paths to check for the icon (prefer ICO for Windows)
-            icon_files = ["app_icon.ico", "app_icon.png"]  # Prefer ICO over PNG
-            icon_paths = []
-            
-            for icon_file in icon_files:
-                paths = [
-                    icon_file,  # Current directory
-                    os.path.join(os.path.dirname(os.path.abspath(__file__)), icon_file),  # Script directory
-                    os.path.join(sys._MEIPASS, icon_file) if hasattr(sys, '_MEIPASS') else None,  # PyInstaller bundle
-                    os.path.join(os.path.dirname(sys.executable), icon_file) if getattr(sys, 'frozen', False) else None,  # Frozen executable directory
-                ]
-                icon_paths.extend([p for p in paths if p is not None])
-            
-            # Remove None entries
-            icon_paths = [path for path in icon_paths if path is not None]
-            
-            for icon_path in icon_paths:
-                if os.path.exists(icon_path):
-                    icon = QIcon(icon_path)
-                    if not icon.isNull():
-                        app.setWindowIcon(icon)
-                        print(f"✅ Application icon set successfully: {icon_path}")
-                        return True
+            icon_path = _resolve_icon_path()
+            if icon_path:
+                app.setWindowIcon(QIcon(icon_path))
+                print(f"✅ Application icon set successfully: {icon_path}")
+                return True
             
             print("⚠️ Application icon not found, using default")
             return False
@@ -0,0 +1,115 @@
+"""
+OCR batch planning for Biosensor Data Capture Tool
+Groups captures into stacked uploads that stay within the Azure OCR v3.2 limits
+and splits the stacked OCR result back into one result per capture
+"""
+
+import bisect
+
+# Azure OCR v3.2 (/vision/v3.2/ocr) rejects images over 4200 px on either side or over 4 MB
+OCR_MAX_IMAGE_SIDE = 4200
+OCR_MAX_IMAGE_BYTES = 4 * 1024 * 1024
+
+
+def plan_ocr_batches(sizes, max_side=OCR_MAX_IMAGE_SIDE, stack=True, max_dimension=None):
+    """
+    Plan vertically stacked OCR uploads for frames of the given sizes
+
+    Args:
+        sizes (list): (width, height) of each frame, in capture order
+        max_side (int): Largest width/height the OCR endpoint accepts
+        stack (bool): Put each frame in its own upload when False (e.g. when
+            orientation detection has to run per frame)
+        max_dimension (int): Optional OCR downscale limit for each frame's
+            longest side (OCR_MAX_DIMENSION), applied on top of max_side
+
+    Returns:
+        tuple: (groups, scales) - groups is a list of lists of frame indices, each
+        stacking to at most max_side on both sides once every frame is resized
+        by its entry in scales (<= 1.0)
+    """
+    limit = min(max_side, max_dimension) if max_dimension else max_side
+    scales = [min(1.0, limit / max(width, height)) for width, height in sizes]
+    groups, group, group_height = [], [], 0
+    for index, (_, height) in enumerate(sizes):
+        scaled_height = scaled_length(height, scales[index])
+        if group and (not stack or group_height + scaled_height > max_side):
+            groups.append(group)
+            group, group_height = [], 0
+        group.append(index)
+        group_height += scaled_height
+    if group:
+        groups.append(group)
+    return groups, scales
+
+
+def scaled_length(length, scale):
+    """Pixel length after resizing by scale (never below 1 px)"""
+    return max(1, int(length * scale))
+
+
+def split_to_fit(items, encode, max_bytes=OCR_MAX_IMAGE_BYTES):
+    """
+    Encode items as one upload, halving the group until every upload fits max_bytes
+
+    Args:
+        items (list): Frames (or indices) to send together
+        encode (callable): Returns the upload bytes for a list of items
+        max_bytes (int): Largest upload the OCR endpoint accepts
+
+    Returns:
+        list: (items, payload) per upload, in order; a single item is returned
+        as-is even if its payload is still too large
+    """
+    payload = encode(items)
+    if len(payload) <= max_bytes or len(items) == 1:
+        return [(items, payload)]
+    middle = len(items) // 2
+    return (split_to_fit(items[:middle], encode, max_bytes)
+            + split_to_fit(items[middle:], encode, max_bytes))
+
+
+def shift_bbox(bbox, dy):
+    """Move an OCR "x,y,w,h" bounding box up by dy pixels"""
+    x, y, w, h = bbox.split(',')
+    return f"{x},{int(y) - dy},{w},{h}"
+
+
+def split_ocr_regions(result, band_tops):
+    """
+    Split the OCR result of vertically stacked frames back into one result per frame
+
+    Args:
+        result (dict): OCR v3.2 response for the stacked image
+        band_tops (list): Each frame's top offset in the stacked image (ascending)
+
+    Returns:
+        list: One OCR result per frame. Each line goes to the frame containing its
+        vertical centre, with coordinates made relative to that frame; regions
+        are re-bounded per frame from their lines.
+    """
+    per_frame = [[] for _ in band_tops]
+    for region in result.get('regions', []):
+        frame_lines = {}
+        for line in region.get('lines', []):
+            _, y, _, h = (int(v) for v in line['boundingBox'].split(','))
+            index = max(0, bisect.bisect_right(band_tops, y + h // 2) - 1)
+            dy = band_tops[index]
+            shifted = dict(line, boundingBox=shift_bbox(line['boundingBox'], dy))
+            shifted['words'] = [dict(word, boundingBox=shift_bbox(word['boundingBox'], dy))
+                                for word in line.get('words', [])]
+            frame_lines.setdefault(index, []).append(shifted)
+        for index, lines in frame_lines.items():
+            # The stacked region may span frames, so each part is bounded by its own lines
+            boxes = [[int(v) for v in line['boundingBox'].split(',')] for line in lines]
+            left = min(x for x, _, _, _ in boxes)
+            top = min(y for _, y, _, _ in boxes)
+            right = max(x + w for x, _, w, _ in boxes)
+            bottom = max(y + h for _, y, _, h in boxes)
+            per_frame[index].append({
+                'boundingBox': f"{left},{top},{right - left},{bottom - top}",
+                'lines': lines
+            })
+
+    header = {key: value for key, value in result.items() if key != 'regions'}
+    return [dict(header, regions=regions) for regions in per_frame]
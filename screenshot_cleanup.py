@@ -0,0 +1,91 @@
+"""
+Screenshot cleanup for Biosensor Data Capture Tool
+Unlinks batches of old screenshots, with one io_uring submission per batch on Linux
+"""
+
+import errno
+import os
+import platform
+
+# Optional io_uring bindings (https://github.com/YoSTEALTH/Liburing), Linux only
+try:
+    if platform.system().lower() == 'linux':
+        import liburing
+        LIBURING_AVAILABLE = True
+    else:
+        LIBURING_AVAILABLE = False
+except ImportError:
+    LIBURING_AVAILABLE = False
+
+URING_BATCH_SIZE = 128
+
+# Set after the first io_uring failure so later sweeps go straight to os.unlink
+_uring_failed = False
+
+
+def _uring_unlink(paths, outcomes):
+    """
+    Unlink paths with io_uring UNLINKAT requests, one submit-and-wait per URING_BATCH_SIZE paths
+
+    Args:
+        paths (list): Files to remove
+        outcomes (dict): Filled in as completions arrive: index in paths -> True if
+            that file was removed. Paths missing from it were never confirmed, so the
+            caller can still unlink them after an exception.
+    """
+    ring = liburing.io_uring()
+    cqes = liburing.io_uring_cqes() if hasattr(liburing, 'io_uring_cqes') else liburing.io_uring_cqe()
+    liburing.io_uring_queue_init(min(len(paths), URING_BATCH_SIZE), ring, 0)
+    try:
+        for start in range(0, len(paths), URING_BATCH_SIZE):
+            chunk = range(start, min(start + URING_BATCH_SIZE, len(paths)))
+            for index in chunk:
+                sqe = liburing.io_uring_get_sqe(ring)
+                liburing.io_uring_prep_unlinkat(sqe, os.fsencode(paths[index]), 0, liburing.AT_FDCWD)
+                liburing.io_uring_sqe_set_data64(sqe, index)  # Completions can arrive out of order
+            liburing.io_uring_submit_and_wait(ring, len(chunk))
+            for _ in chunk:
+                liburing.io_uring_wait_cqe(ring, cqes)
+                cqe = cqes[0] if hasattr(cqes, '__getitem__') else cqes
+                index = cqe.user_data
+                outcomes[index] = cqe.res == 0
+                if cqe.res not in (0, -errno.ENOENT):  # Already-removed files are fine
+                    print(f"DEBUG: Failed to delete screenshot: {paths[index]}, Error: {os.strerror(-cqe.res)}")
+                liburing.io_uring_cqe_seen(ring, cqe)
+    finally:
+        liburing.io_uring_queue_exit(ring)
+
+
+def bulk_unlink(paths):
+    """
+    Unlink paths as one batch
+
+    On Linux with liburing installed the batch goes out as io_uring submissions;
+    otherwise, or for whatever the ring didn't get to, it's an os.unlink loop.
+
+    Args:
+        paths (list): Screenshot files to remove
+
+    Returns:
+        int: Number of files removed
+    """
+    global _uring_failed
+    outcomes = {}
+    if LIBURING_AVAILABLE and not _uring_failed and paths:
+        try:
+            _uring_unlink(paths, outcomes)
+        except Exception as e:
+            _uring_failed = True
+            print(f"DEBUG: io_uring unavailable, unlinking screenshots one by one: {e}")
+    deleted = sum(outcomes.values())
+    for index, path in enumerate(paths):
+        if index in outcomes:
+            continue
+        try:
+            os.unlink(path)
+            deleted += 1
+        except FileNotFoundError:
+            pass  # Already removed outside the app
+        except OSError as delete_error:
+            print(f"DEBUG: Failed to delete screenshot: {path}, Error: {delete_error}")
+    return deleted
@@ -5,73 +5,305 @@ This script helps install dependencies and check the environment.
 """
 
 import sys
+
+# Bail out before importing anything else on an unsupported interpreter
+if sys.version_info < (3, 7):
+    sys.stderr.write("❌ Python 3.7 or higher is required.\n")
+    sys.stderr.write("   Current version: %s\n" % sys.version)
+    sys.exit(1)
+
 import subprocess
 import os
+import hashlib
+import tempfile
+import threading
+import importlib.util
+
+try:
+    import importlib.metadata as importlib_metadata  # Python 3.8+
+except ImportError:
+    importlib_metadata = None
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
+QUIET = bool(os.environ.get('SETUP_QUIET'))
+
+def log(message):
+    """Print a progress line unless SETUP_QUIET is set; the final summary always prints"""
+    if not QUIET:
+        sys.stdout.write(f"{message}\n")
+
+def log_error(message):
+    """Write a failure or warning line to stderr, even with SETUP_QUIET set"""
+    sys.stderr.write(f"{message}\n")
+
 def check_python_version():
     """Check if Python version is compatible"""
-    print("🐍 Checking Python version...")
+    log("🐍 Checking Python version...")
     if sys.version_info < (3, 7):
-        print("❌ Python 3.7 or higher is required.")
-        print(f"   Current version: {sys.version}")
+        log_error("❌ Python 3.7 or higher is required.")
+        log_error(f"   Current version: {sys.version}")
         return False
     else:
-        print(f"✅ Python {sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro} is compatible")
+        log(f"✅ Python {sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro} is compatible")
         return True
 
+SETUP_CACHE_DIR = Path('.setup_cache')
+REQUIREMENTS_MARKER = SETUP_CACHE_DIR / 'requirements.sha256'
+PYTHON_VERSION_MARKER = SETUP_CACHE_DIR / 'python_version'
+SCRCPY_MARKER = SETUP_CACHE_DIR / 'scrcpy_present'
+
+LOCK_FILE = 'requirements.lock'
+
+def requirements_digest():
+    """Return the SHA-256 of requirements.txt (plus the lock file, if any), or None if it doesn't exist"""
+    digest = hashlib.sha256()
+    try:
+        with open('requirements.txt', 'rb') as f:
+            digest.update(f.read())
+    except FileNotFoundError:
+        return None
+    try:
+        with open(LOCK_FILE, 'rb') as f:
+            digest.update(f.read())
+    except FileNotFoundError:
+        pass
+    return digest.hexdigest()
+
+def read_requirements(path='requirements.txt'):
+    """Parse a requirements file into pip arguments, or None if it can't be passed inline"""
+    try:
+        with open(path, encoding='utf-8') as f:
+            lines = f.read().splitlines()
+    except (OSError, UnicodeDecodeError):
+        return None
+    requirements = []
+    for line in lines:
+        line = line.split(' #', 1)[0].strip()
+        if not line or line.startswith('#'):
+            continue
+        if line.startswith('-'):
+            # Options (-r, --index-url, ...) need pip's own file parser
+            return None
+        requirements.append(line)
+    return requirements
+
+def current_python_version():
+    """Python version string used to invalidate the install marker"""
+    return '.'.join(str(part) for part in sys.version_info[:3])
+
+def install_marker_valid(digest):
+    """Check whether the last successful install matches requirements.txt and this Python"""
+    if digest is None:
+        return False
+    try:
+        return (REQUIREMENTS_MARKER.read_text().strip() == digest
+                and PYTHON_VERSION_MARKER.read_text().strip() == current_python_version())
+    except OSError:
+        return False
+
+def write_install_marker(digest):
+    """Record a successful install so re-runs can skip pip"""
+    if digest is None:
+        return
+    try:
+        SETUP_CACHE_DIR.mkdir(exist_ok=True)
+        REQUIREMENTS_MARKER.write_text(digest)
+        PYTHON_VERSION_MARKER.write_text(current_python_version())
+    except OSError as e:
+        log_error(f"⚠️ Could not write install cache: {e}")
+
+# Take wheels over sdists (no compiler needed) and leave .pyc files to first import
+# A project-specific cache survives between runs and can be restored on CI runners
+PIP_CACHE_DIR = os.environ.get('PIP_CACHE_DIR') or os.path.join(
+    os.path.expanduser('~'), '.cache', 'pip-miband6gui')
+PIP_INSTALL_FLAGS = ['--prefer-binary', '--no-compile', '--cache-dir', PIP_CACHE_DIR]
+if QUIET:
+    PIP_INSTALL_FLAGS.append('--quiet')
+# PyQt5 and Pillow ship wheels for every supported platform; never build them from source
+WHEEL_ONLY_FLAG = '--only-binary=PyQt5,Pillow'
+
+WHEELHOUSE_DIR = Path('wheelhouse')
+WHEELHOUSE_MARKER = SETUP_CACHE_DIR / 'wheelhouse.sha256'
+
+def run_pip(cmd, check=True):
+    """Run a pip command in this interpreter, falling back to a subprocess.
+
+    Calling pip's CLI entry point directly saves a Python cold start per attempt.
+    pip doesn't guarantee that internal API, so any import or runtime failure
+    from it drops back to `python -m pip`. Returns pip's exit code, raising
+    CalledProcessError for a non-zero code when `check` is set.
+    """
+    try:
+        from pip._internal.cli.main import main as pip_main
+        returncode = pip_main(cmd)
+    except Exception:
+        returncode = subprocess.call([sys.executable, "-m", "pip", *cmd])
+    if check and returncode != 0:
+        raise subprocess.CalledProcessError(returncode, ['pip', *cmd])
+    return returncode
+
+def pip_install(*args, check=True):
+    """Run `pip install` with the shared flags; see run_pip"""
+    return run_pip(['install', *PIP_INSTALL_FLAGS, *args], check=check)
+
+def build_wheelhouse(digest, requirement_args):
+    """Download wheels for requirements.txt into ./wheelhouse once per requirements/Python version"""
+    if digest is None:
+        return False
+    key = f"{digest} {current_python_version()}"
+    try:
+        if WHEELHOUSE_DIR.is_dir() and WHEELHOUSE_MARKER.read_text().strip() == key:
+            return True
+    except OSError:
+        pass
+    
+    log("📥 Downloading wheels into the local wheelhouse...")
+    cmd = ['download', '--prefer-binary', '--cache-dir', PIP_CACHE_DIR,
+           '-d', str(WHEELHOUSE_DIR), *requirement_args]
+    if QUIET:
+        cmd.append('--quiet')
+    if run_pip(cmd, check=False) != 0:
+        log_error("⚠️ Could not build the wheelhouse, installing from the index instead")
+        return False
+    try:
+        SETUP_CACHE_DIR.mkdir(exist_ok=True)
+        WHEELHOUSE_MARKER.write_text(key)
+    except OSError:
+        pass
+    return True
+
 def install_dependencies():
     """Install required Python packages"""
-    print("\n📦 Installing Python dependencies...")
+    log("\n📦 Installing Python dependencies...")
+    
+    # Skip pip entirely when requirements.txt and Python haven't changed since the last install
+    digest = requirements_digest()
+    if install_marker_valid(digest):
+        deps_ok, _ = check_dependencies()
+        if deps_ok:
+            log("✅ Dependencies already installed (requirements.txt unchanged)")
+            return True
     
     # Check Python version for compatibility warnings
     if sys.version_info >= (3, 13):
-        print("⚠️ Python 3.13+ detected. Some packages may need alternative installation.")
+        log_error("⚠️ Python 3.13+ detected. Some packages may need alternative installation.")
+    
+    # A pinned, hashed lock (pip-compile --generate-hashes requirements.txt -o requirements.lock)
+    # already lists every transitive dependency, so pip can skip the resolver entirely
+    if os.path.exists(LOCK_FILE):
+        try:
+            pip_install('--no-deps', '--require-hashes', '-r', LOCK_FILE)
+            log(f"✅ Dependencies installed successfully from {LOCK_FILE}")
+            write_install_marker(digest)
+            return True
+        except subprocess.CalledProcessError as e:
+            log_error(f"❌ Failed to install from {LOCK_FILE}: {e}")
+            log("\n🔄 Falling back to requirements.txt...")
+    
+    # Try main requirements first, passed inline so pip gets them as one batch
+    requirements = read_requirements()
+    requirement_args = requirements or ['-r', 'requirements.txt']
+    
+    # Repeat installs come straight from the local wheelhouse without touching the network
+    if build_wheelhouse(digest, requirement_args):
+        try:
+            pip_install('--no-index', '--find-links', str(WHEELHOUSE_DIR), *requirement_args)
+            log("✅ Dependencies installed successfully from the wheelhouse")
+            write_install_marker(digest)
+            return True
+        except subprocess.CalledProcessError as e:
+            log_error(f"❌ Failed to install from the wheelhouse: {e}")
     
-    # Try main requirements first
     try:
-        subprocess.check_call([sys.executable, "-m", "pip", "install", "-r", "requirements.txt"])
-        print("✅ Dependencies installed successfully")
+        pip_install(*requirement_args)
+        log("✅ Dependencies installed successfully")
+        write_install_marker(digest)
         return True
     except subprocess.CalledProcessError as e:
-        print(f"❌ Failed to install from requirements.txt: {e}")
-        print("\n🔄 Trying fallback installation method...")
-        
-        # Try fallback requirements
-        try:
-            subprocess.check_call([sys.executable, "-m", "pip", "install", "-r", "requirements_fallback.txt"])
-            print("✅ Fallback dependencies installed successfully")
-            return True
-        except subprocess.CalledProcessError as e2:
-            print(f"❌ Fallback installation also failed: {e2}")
-            print("\n🛠️ Trying individual package installation...")
-            
-            # Try installing packages individually
-            packages = ['PyQt5', 'pygetwindow', 'PyAutoGUI', 'requests', 'Pillow']
-            success_count = 0
+        log_error(f"❌ Failed to install from requirements.txt: {e}")
+    
+    # Only retry what's actually missing after the main install
+    packages = ['PyQt5', 'pygetwindow', 'PyAutoGUI', 'requests', 'Pillow']
+    _, missing = check_dependencies()
+    missing = {name.lower() for name in missing}
+    remaining = [package for package in packages if package.lower() in missing]
+    if not remaining:
+        log("✅ Core packages are installed")
+        return True
+    
+    # One pip call shares a single resolve and download session; only the
+    # packages that are still missing afterwards get installed one by one
+    log("\n🛠️ Installing missing packages...")
+    if pip_install(WHEEL_ONLY_FLAG, *remaining, check=False) == 0:
+        remaining = []
+    else:
+        _, missing = check_dependencies()
+        missing = {name.lower() for name in missing}
+        remaining = [package for package in remaining if package.lower() in missing]
+    success_count = len(packages) - len(remaining)
+    
+    if not remaining:
+        pass
+    elif os.getenv('SETUP_SERIAL'):
+        # Serial path kept for debugging: pip output streams straight to the console
+        for package in remaining:
+            try:
+                pip_install(WHEEL_ONLY_FLAG, package)
+                log(f"✅ {package} installed")
+                success_count += 1
+            except subprocess.CalledProcessError:
+                log_error(f"❌ Failed to install {package}")
+    else:
+        # Downloads are network-bound and each goes to its own directory, so they overlap;
+        # output is captured per package so they don't interleave on the console. The
+        # installs then run one at a time, since two pip processes writing a shared
+        # dependency (pyrect, for one) into site-packages at once can corrupt it
+        with tempfile.TemporaryDirectory(prefix='setup-wheels-') as download_root:
+            download_dirs = {package: os.path.join(download_root, str(index))
+                             for index, package in enumerate(remaining)}
+            downloaded = set()
+            with ThreadPoolExecutor(max_workers=min(len(remaining), 5)) as executor:
+                futures = {
+                    executor.submit(subprocess.run,
+                                    [sys.executable, "-m", "pip", "download", "--prefer-binary",
+                                     "--cache-dir", PIP_CACHE_DIR, WHEEL_ONLY_FLAG,
+                                     "-d", download_dirs[package], package],
+                                    capture_output=True, text=True): package
+                    for package in remaining
+                }
+                for future in as_completed(futures):
+                    package = futures[future]
+                    result = future.result()
+                    if result.returncode == 0:
+                        downloaded.add(package)
+                    else:
+                        log_error(f"❌ Failed to download {package}")
+                        if result.stderr:
+                            log_error(result.stderr.strip().splitlines()[-1])
             
-            for package in packages:
-                try:
-                    subprocess.check_call([sys.executable, "-m", "pip", "install", package])
-                    print(f"✅ {package} installed")
+            find_links = [arg for package in remaining if package in downloaded
+                          for arg in ('--find-links', download_dirs[package])]
+            for package in remaining:
+                if package not in downloaded:
+                    continue
+                if pip_install('--no-index', *find_links, WHEEL_ONLY_FLAG, package, check=False) == 0:
+                    log(f"✅ {package} installed")
                     success_count += 1
-                except subprocess.CalledProcessError:
-                    print(f"❌ Failed to install {package}")
-            
-            if success_count >= 3:  # At least core packages installed
-                print(f"✅ Installed {success_count}/{len(packages)} packages")
-                return True
-            else:
-                print(f"❌ Only {success_count}/{len(packages)} packages installed")
-                return False
-                
-    except FileNotFoundError:
-        print("❌ requirements.txt file not found")
+                else:
+                    log_error(f"❌ Failed to install {package}")
+    
+    # Anything short of every core package counts as a failure, so main() re-checks what's missing
+    if success_count == len(packages):
+        log(f"✅ Installed {success_count}/{len(packages)} packages")
+        return True
+    else:
+        log_error(f"❌ Only {success_count}/{len(packages)} packages installed")
         return False
 
 def check_dependencies():
     """Check if required packages are installed"""
-    print("\n🔍 Checking installed packages...")
+    log("\n🔍 Checking installed packages...")
     required_packages = [
         'PyQt5',
         'pygetwindow', 
@@ -82,103 +314,181 @@ def check_dependencies():
     
     missing_packages = []
     
+    if importlib_metadata is not None:
+        # One scan of site-packages covers every package, instead of a lookup per import
+        installed = {
+            (dist.metadata['Name'] or '').lower().replace('_', '-')
+            for dist in importlib_metadata.distributions()
+        }
+        for package in required_packages:
+            if package.lower().replace('_', '-') in installed:
+                log(f"✅ {package} is installed")
+            else:
+                log_error(f"❌ {package} is missing")
+                missing_packages.append(package)
+        return len(missing_packages) == 0, missing_packages
+    
+    # Distribution name -> import name where they differ
+    import_names = {'PyQt5': 'PyQt5', 'Pillow': 'PIL'}
+    
     for package in required_packages:
-        try:
-            __import__(package.lower().replace('-', '_'))
-            print(f"✅ {package} is installed")
-        except ImportError:
-            print(f"❌ {package} is missing")
+        # find_spec only asks the import finders, so PyQt5/Pillow's extensions aren't loaded
+        module = import_names.get(package, package.lower().replace('-', '_'))
+        if importlib.util.find_spec(module) is None:
+            log_error(f"❌ {package} is missing")
             missing_packages.append(package)
+        else:
+            log(f"✅ {package} is installed")
     
     return len(missing_packages) == 0, missing_packages
 
 def create_directories():
     """Create necessary directories"""
-    print("\n📁 Creating directories...")
+    log("\n📁 Creating directories...")
     directories = ['screenshots']
     
     for directory in directories:
-        Path(directory).mkdir(exist_ok=True)
-        print(f"✅ Created/verified directory: {directory}")
+        os.makedirs(directory, exist_ok=True)
+        log(f"✅ Created/verified directory: {directory}")
 
 def check_config():
     """Check configuration file"""
-    print("\n⚙️ Checking configuration...")
+    log("\n⚙️ Checking configuration...")
+
+    if os.environ.get('SETUP_SKIP_CONFIG_CHECK') == '1':
+        log("⏭️ Skipping configuration check (SETUP_SKIP_CONFIG_CHECK=1)")
+        return True
 
-    if not os.path.exists('config.py'):
-        print("❌ config.py file not found")
-        return False
-    
     try:
         from config import AZURE_ENDPOINT
         AZURE_API_KEY = os.getenv('AZURE_API_KEY')  # Get the API key from environment variable
 
         if not AZURE_API_KEY:
-            print("⚠️ AZURE_API_KEY is not set in environment variables")
+            log_error("⚠️ AZURE_API_KEY is not set in environment variables")
             return False
 
         # Check for missing or incorrect API key and endpoint
         if AZURE_API_KEY == "your_azure_api_key_here":
-            print("⚠️ Azure API key not configured in environment variables")
-            print("   Please update AZURE_API_KEY with your actual API key")
+            log_error("⚠️ Azure API key not configured in environment variables")
+            log_error("   Please update AZURE_API_KEY with your actual API key")
             return False
 
         if AZURE_ENDPOINT == "https://wrist.cognitiveservices.azure.com/":
-            print("⚠️ Azure endpoint not configured in config.py")
-            print("   Please update AZURE_ENDPOINT with your actual endpoint")
+            log_error("⚠️ Azure endpoint not configured in config.py")
+            log_error("   Please update AZURE_ENDPOINT with your actual endpoint")
             return False
         
-        print("✅ Configuration file looks good")
+        log("✅ Configuration file looks good")
         return True
 
     except ImportError as e:
-        print(f"❌ Error importing config: {e}")
+        if isinstance(e, ModuleNotFoundError) and e.name == 'config':
+            log_error("❌ config.py file not found")
+        else:
+            log_error(f"❌ Error importing config: {e}")
         return False
 
 def check_scrcpy():
     """Check if scrcpy is available"""
-    print("\n📱 Checking scrcpy...")
+    log("\n📱 Checking scrcpy...")
+    # A previous run already found scrcpy on this exact PATH
+    path_digest = hashlib.sha256(os.environ.get('PATH', '').encode()).hexdigest()
     try:
-        result = subprocess.run(['scrcpy', '--version'], 
-                              capture_output=True, text=True, timeout=5)
+        if SCRCPY_MARKER.read_text().strip() == path_digest:
+            log("✅ scrcpy is installed and accessible")
+            return True
+    except OSError:
+        pass
+    
+    try:
+        # Only the exit code matters, so skip the output pipes and fd sweep in the child
+        result = subprocess.run(['scrcpy', '--version'],
+                                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                                timeout=5, close_fds=False)
         if result.returncode == 0:
-            print("✅ scrcpy is installed and accessible")
+            log("✅ scrcpy is installed and accessible")
+            try:
+                SETUP_CACHE_DIR.mkdir(exist_ok=True)
+                SCRCPY_MARKER.write_text(path_digest)
+            except OSError:
+                pass
             return True
         else:
-            print("❌ scrcpy command failed")
+            log_error("❌ scrcpy command failed")
             return False
     except (subprocess.TimeoutExpired, FileNotFoundError):
-        print("❌ scrcpy not found in PATH")
-        print("   Please install scrcpy from: https://github.com/Genymobile/scrcpy")
+        log_error("❌ scrcpy not found in PATH")
+        log_error("   Please install scrcpy from: https://github.com/Genymobile/scrcpy")
         return False
 
+class ThreadBufferedOutput:
+    """sys.stdout/sys.stderr stand-in that keeps each worker thread's output in its own buffer"""
+
+    def __init__(self, stream, local):
+        self.stream = stream
+        self.local = local  # Shared by stdout and stderr so their lines stay in order
+
+    def write(self, text):
+        chunks = getattr(self.local, 'chunks', None)
+        if chunks is None:
+            return self.stream.write(text)
+        chunks.append((self.stream, text))
+        return len(text)
+
+    def flush(self):
+        self.stream.flush()
+
+def run_checks_concurrently(*checks):
+    """Run independent checks on a thread pool, printing each one's output in order"""
+    stdout, stderr = sys.stdout, sys.stderr
+    local = threading.local()
+
+    def run(check):
+        local.chunks = []
+        try:
+            return check(), local.chunks
+        finally:
+            local.chunks = None
+
+    sys.stdout = ThreadBufferedOutput(stdout, local)
+    sys.stderr = ThreadBufferedOutput(stderr, local)
+    try:
+        with ThreadPoolExecutor(max_workers=len(checks)) as executor:
+            futures = [executor.submit(run, check) for check in checks]
+            results = []
+            for future in futures:
+                result, chunks = future.result()
+                for stream, text in chunks:
+                    stream.write(text)
+                results.append(result)
+    finally:
+        sys.stdout, sys.stderr = stdout, stderr
+    return results
+
 def main():
     """Main setup function"""
-    print("🔬 Biosensor Data Capture Tool - Setup")
-    print("=" * 50)
+    log("🔬 Biosensor Data Capture Tool - Setup")
+    log("=" * 50)
     
     # Check Python version
     if not check_python_version():
         sys.exit(1)
     
-    # Install dependencies
-    if not install_dependencies():
-        print("\n⚠️ Dependency installation failed. Checking what's already installed...")
+    # Install dependencies; a successful install already verified the packages
+    install_ok = install_dependencies()
+    if not install_ok:
+        log_error("\n⚠️ Dependency installation failed. Checking what's already installed...")
     
-    # Check dependencies
-    deps_ok, missing = check_dependencies()
+    # The remaining checks are independent, so the scrcpy probe (up to a 5s timeout)
+    # overlaps with the package scan and config import
+    checks = [create_directories, check_config, check_scrcpy]
+    if not install_ok:
+        checks.append(check_dependencies)
+    _, config_ok, scrcpy_ok, *deps_result = run_checks_concurrently(*checks)
+    deps_ok, missing = deps_result[0] if deps_result else (True, [])
     if not deps_ok:
-        print(f"\n❌ Missing packages: {', '.join(missing)}")
-        print("   Try running: pip install -r requirements.txt")
-    
-    # Create directories
-    create_directories()
-    
-    # Check configuration
-    config_ok = check_config()
-    
-    # Check scrcpy
-    scrcpy_ok = check_scrcpy()
+        log_error(f"\n❌ Missing packages: {', '.join(missing)}")
+        log_error("   Try running: pip install -r requirements.txt")
     
     # Summary
     print("\n" + "=" * 50)
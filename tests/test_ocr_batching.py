@@ -0,0 +1,86 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ocr_batching import (
+    OCR_MAX_IMAGE_BYTES, OCR_MAX_IMAGE_SIDE, plan_ocr_batches, scaled_length,
+    split_ocr_regions, split_to_fit
+)
+
+
+def _stacked_size(group, sizes, scales):
+    width = max(scaled_length(sizes[i][0], scales[i]) for i in group)
+    height = sum(scaled_length(sizes[i][1], scales[i]) for i in group)
+    return width, height
+
+
+def test_phone_captures_are_split_under_the_side_limit():
+    sizes = [(1080, 2400)] * 7
+    groups, scales = plan_ocr_batches(sizes)
+    assert [i for group in groups for i in group] == list(range(7))
+    assert scales == [1.0] * 7
+    for group in groups:
+        width, height = _stacked_size(group, sizes, scales)
+        assert width <= OCR_MAX_IMAGE_SIDE
+        assert height <= OCR_MAX_IMAGE_SIDE
+
+
+def test_small_captures_share_one_upload():
+    groups, _ = plan_ocr_batches([(400, 1000)] * 4)
+    assert groups == [[0, 1, 2, 3]]
+
+
+def test_oversized_capture_is_downscaled_to_fit():
+    sizes = [(1440, 9000), (5000, 800)]
+    groups, scales = plan_ocr_batches(sizes)
+    assert scales[0] < 1.0 and scales[1] < 1.0
+    for group in groups:
+        width, height = _stacked_size(group, sizes, scales)
+        assert width <= OCR_MAX_IMAGE_SIDE
+        assert height <= OCR_MAX_IMAGE_SIDE
+
+
+def test_no_stacking_gives_one_frame_per_upload():
+    groups, _ = plan_ocr_batches([(400, 1000)] * 3, stack=False)
+    assert groups == [[0], [1], [2]]
+
+
+def test_uploads_over_the_byte_limit_are_halved():
+    def encode(items):
+        return b'x' * (len(items) * OCR_MAX_IMAGE_BYTES // 3)
+
+    uploads = split_to_fit(list(range(8)), encode)
+    assert [i for items, _ in uploads for i in items] == list(range(8))
+    assert all(len(payload) <= OCR_MAX_IMAGE_BYTES for _, payload in uploads)
+
+
+def test_max_dimension_downscales_each_frame():
+    _, scales = plan_ocr_batches([(1080, 2400), (400, 1000)], max_dimension=1200)
+    assert scales == [0.5, 1.0]
+
+
+def _line(text, bbox):
+    return {'boundingBox': bbox, 'text': text, 'words': [{'boundingBox': bbox, 'text': text}]}
+
+
+def test_stacked_result_is_split_back_per_frame():
+    result = {
+        'language': 'en',
+        'orientation': 'Up',
+        'regions': [{
+            'boundingBox': '10,50,200,1000',
+            'lines': [_line('72 bpm', '10,50,100,20'), _line('98 %', '20,1030,80,20')]
+        }, {
+            'boundingBox': '30,1500,60,20',
+            'lines': [_line('7500 steps', '30,1500,60,20')]
+        }]
+    }
+
+    first, second = split_ocr_regions(result, [0, 1000])
+
+    assert first['language'] == second['language'] == 'en'
+    assert [line['text'] for region in first['regions'] for line in region['lines']] == ['72 bpm']
+    assert first['regions'][0]['boundingBox'] == '10,50,100,20'
+    assert [region['boundingBox'] for region in second['regions']] == ['20,30,80,20', '30,500,60,20']
+    assert second['regions'][0]['lines'][0]['words'][0]['boundingBox'] == '20,30,80,20'
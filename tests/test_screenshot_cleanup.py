@@ -0,0 +1,120 @@
+import errno
+import os
+import sys
+import types
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import screenshot_cleanup
+
+
+class FakeLiburing:
+    """Stand-in for the liburing binding: each unlink runs when its completion is reaped, in reverse order"""
+    AT_FDCWD = -100
+
+    def __init__(self, fail_after=None):
+        self.fail_after = fail_after  # Raise from wait_cqe after this many completions
+        self.unlinked = []
+
+    def io_uring(self):
+        return types.SimpleNamespace(sqes=[], cqes=[])
+
+    def io_uring_cqes(self):
+        return [None]
+
+    def io_uring_queue_init(self, entries, ring, flags):
+        pass
+
+    def io_uring_queue_exit(self, ring):
+        pass
+
+    def io_uring_get_sqe(self, ring):
+        sqe = types.SimpleNamespace(path=None, user_data=None)
+        ring.sqes.append(sqe)
+        return sqe
+
+    def io_uring_prep_unlinkat(self, sqe, path, flags, dirfd):
+        sqe.path = path
+
+    def io_uring_sqe_set_data64(self, sqe, data):
+        sqe.user_data = data
+
+    def io_uring_submit_and_wait(self, ring, count):
+        ring.cqes, ring.sqes = ring.sqes[::-1], []
+        return count
+
+    def io_uring_wait_cqe(self, ring, cqes):
+        if self.fail_after == 0:
+            raise OSError(errno.EIO, "ring torn down")
+        sqe = ring.cqes.pop(0)
+        try:
+            os.unlink(sqe.path)
+            self.unlinked.append(os.fsdecode(sqe.path))
+            res = 0
+        except FileNotFoundError:
+            res = -errno.ENOENT
+        cqes[0] = types.SimpleNamespace(res=res, user_data=sqe.user_data)
+        if self.fail_after is not None:
+            self.fail_after -= 1
+
+    def io_uring_cqe_seen(self, ring, cqe):
+        pass
+
+
+@pytest.fixture
+def screenshots(tmp_path):
+    paths = []
+    for i in range(5):
+        path = tmp_path / f"screenshot_{i}.png"
+        path.write_bytes(b'png')
+        paths.append(str(path))
+    return paths
+
+
+@pytest.fixture
+def fake_uring(monkeypatch):
+    def install(**kwargs):
+        fake = FakeLiburing(**kwargs)
+        monkeypatch.setattr(screenshot_cleanup, 'liburing', fake, raising=False)
+        monkeypatch.setattr(screenshot_cleanup, 'LIBURING_AVAILABLE', True)
+        monkeypatch.setattr(screenshot_cleanup, '_uring_failed', False)
+        return fake
+    return install
+
+
+def test_fallback_unlinks_and_counts_existing_files(monkeypatch, screenshots):
+    monkeypatch.setattr(screenshot_cleanup, 'LIBURING_AVAILABLE', False)
+    os.unlink(screenshots[2])  # Already removed outside the app
+
+    assert screenshot_cleanup.bulk_unlink(screenshots) == 4
+    assert not any(os.path.exists(path) for path in screenshots)
+
+
+def test_uring_unlinks_the_whole_batch(fake_uring, screenshots):
+    fake = fake_uring()
+    os.unlink(screenshots[0])
+
+    assert screenshot_cleanup.bulk_unlink(screenshots) == 4
+    assert sorted(fake.unlinked) == sorted(screenshots[1:])
+    assert not screenshot_cleanup._uring_failed
+
+
+def test_uring_failure_only_retries_unconfirmed_paths(fake_uring, screenshots, capsys):
+    fake = fake_uring(fail_after=2)
+
+    assert screenshot_cleanup.bulk_unlink(screenshots) == 5
+    assert sorted(fake.unlinked) == sorted(screenshots[3:])
+    assert not any(os.path.exists(path) for path in screenshots)
+    assert screenshot_cleanup._uring_failed
+    assert capsys.readouterr().out.count("io_uring unavailable") == 1
+
+
+def test_uring_is_not_retried_after_a_failure(fake_uring, screenshots, capsys):
+    fake = fake_uring()
+    screenshot_cleanup._uring_failed = True
+
+    assert screenshot_cleanup.bulk_unlink(screenshots) == 5
+    assert fake.unlinked == []
+    assert "io_uring" not in capsys.readouterr().out